@@ -0,0 +1,3 @@
+"""
+Benchmarks of colorhash functions, run them with ``python -m benchmarks``.
+"""
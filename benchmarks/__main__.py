@@ -0,0 +1,91 @@
+"""
+Run benchmarks and print (or save as JSON) their results.
+
+    $ python -m benchmarks                      # run all
+    $ python -m benchmarks -k color_hash        # run matching cases only
+    $ python -m benchmarks --json new.json      # save results
+    $ python -m benchmarks --compare old.json   # compare with saved results
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+import colorhash
+
+from .cases import CASES
+from .cases import Case
+
+
+def run_case(case: Case, repeat: int) -> dict[str, Any] | None:
+    """
+    Measure case, return its result (or ``None`` if it can't run here).
+    """
+    try:
+        func = case.setup()
+    except ImportError:
+        return None
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    secs_per_op = best / number / case.n
+    return {
+        "name": case.name,
+        "ns_per_op": secs_per_op * 1e9,
+        "ops_per_sec": 1 / secs_per_op,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="run matching cases")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="repeats")
+    parser.add_argument("--json", type=Path, help="save results to JSON file")
+    parser.add_argument("--compare", type=Path, help="compare with JSON file")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with args.compare.open(encoding="utf-8") as f:
+            baseline = {x["name"]: x for x in json.load(f)["results"]}
+
+    results = []
+    print(f"{'case':<40} {'ns/op':>12} {'ops/s':>14}")
+    for case in CASES:
+        if args.filter not in case.name:
+            continue
+        result = run_case(case, args.repeat)
+        if result is None:
+            print(f"{case.name:<40} {'skipped':>12}")
+            continue
+        results.append(result)
+        line = (
+            f"{case.name:<40} {result['ns_per_op']:>12.1f} "
+            f"{result['ops_per_sec']:>14,.0f}"
+        )
+        if case.name in baseline:
+            change = result["ns_per_op"] / baseline[case.name]["ns_per_op"] - 1
+            line += f" {change:>+8.1%}"
+        print(line)
+
+    if args.json:
+        data = {
+            "colorhash": colorhash.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with args.json.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+"""
+Benchmark cases.
+
+Every case is a function registered by ``@bench()``. It prepares data and
+returns a callable doing the measured work (``n`` operations per call). Cases
+needing optional dependencies raise ``ImportError`` from setup to be skipped.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+
+from colorhash import ColorHash
+from colorhash import ColorHasher
+from colorhash.colorhash import HASH_FUNCTIONS
+from colorhash.colorhash import color_hash
+from colorhash.colorhash import color_hash_dedup
+from colorhash.colorhash import color_hash_int
+from colorhash.colorhash import color_hash_int_many
+from colorhash.colorhash import color_hash_many
+from colorhash.colorhash import crc32_hash
+from colorhash.colorhash import crc32_hash_bytes
+from colorhash.colorhash import crc32_hash_canonical
+from colorhash.colorhash import crc32_hash_stream
+from colorhash.colorhash import hsl2rgb
+from colorhash.colorhash import hsl2rgb_float
+from colorhash.colorhash import hsl2rgb_many
+from colorhash.colorhash import hue_to_rgb
+from colorhash.colorhash import rgb2hex
+from colorhash.colorhash import rgb2hex_many
+from colorhash.palette import assign_palette
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    n: int  # operations per call
+
+
+CASES: list[Case] = []
+
+SHORT_STR = "user-12345"
+LONG_STR = "lorem ipsum dolor sit amet " * 400  # ~10 kB
+TUPLE = ("a", 1, 2.5, None)
+BULK_KEYS = [f"user-{i}" for i in range(100_000)]
+# 100 distinct keys, each repeated 1000x
+REPEATED_KEYS = [f"service-{i % 100}" for i in range(100_000)]
+# one run of a short-lived job
+JOB_KEYS = BULK_KEYS[:1000]
+PALETTE_9 = [x / 10 for x in range(1, 10)]
+
+
+def bench(name: str, n: int = 1) -> Callable:
+    """
+    Register benchmark case.
+    """
+
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable:
+        CASES.append(Case(name, setup, n))
+        return setup
+
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# single call latency
+# ---------------------------------------------------------------------------
+
+
+@bench("crc32_hash/short_str")
+def _():
+    return lambda: crc32_hash(SHORT_STR)
+
+
+@bench("crc32_hash/long_str")
+def _():
+    return lambda: crc32_hash(LONG_STR)
+
+
+@bench("crc32_hash/int")
+def _():
+    return lambda: crc32_hash(1234567890)
+
+
+@bench("crc32_hash/tuple")
+def _():
+    return lambda: crc32_hash(TUPLE)
+
+
+@bench("crc32_hash/set_1000")
+def _():
+    keys = set(BULK_KEYS[:1000])
+    return lambda: crc32_hash(keys)
+
+
+@bench("crc32_hash_canonical/tuple")
+def _():
+    return lambda: crc32_hash_canonical(TUPLE)
+
+
+@bench("crc32_hash_canonical/set_1000")
+def _():
+    keys = set(BULK_KEYS[:1000])
+    return lambda: crc32_hash_canonical(keys)
+
+
+@bench("crc32_hash_bytes/short_bytes")
+def _():
+    data = SHORT_STR.encode()
+    return lambda: crc32_hash_bytes(data)
+
+
+@bench("crc32_hash_bytes/long_bytes")
+def _():
+    data = LONG_STR.encode()
+    return lambda: crc32_hash_bytes(data)
+
+
+def _hashfunc_cases() -> None:
+    for name, func in HASH_FUNCTIONS.items():
+        data = SHORT_STR.encode()
+
+        @bench(f"hashfunc/{name}")
+        def _(func=func, data=data):
+            return lambda: func(data)
+
+        @bench(f"ColorHasher/hex_{name}")
+        def _(name=name):
+            hasher = ColorHasher(hashfunc=name)
+            return lambda: hasher.hex(SHORT_STR)
+
+
+_hashfunc_cases()
+
+
+@bench("hue_to_rgb")
+def _():
+    return lambda: hue_to_rgb(0.2, 0.8, 0.4)
+
+
+@bench("hsl2rgb")
+def _():
+    return lambda: hsl2rgb((131, 0.65, 0.5))
+
+
+@bench("hsl2rgb_float")
+def _():
+    return lambda: hsl2rgb_float((131, 0.65, 0.5))
+
+
+@bench("hsl2rgb/float_hue")
+def _():
+    return lambda: hsl2rgb((131.5, 0.65, 0.5))
+
+
+@bench("rgb2hex")
+def _():
+    return lambda: rgb2hex((45, 210, 75))
+
+
+@bench("color_hash/default")
+def _():
+    return lambda: color_hash(SHORT_STR)
+
+
+@bench("color_hash/lightness_1")
+def _():
+    return lambda: color_hash(SHORT_STR, lightness=[0.5])
+
+
+@bench("color_hash/palette_9x9")
+def _():
+    return lambda: color_hash(SHORT_STR, lightness=PALETTE_9, saturation=PALETTE_9)
+
+
+@bench("color_hash/hue_range")
+def _():
+    return lambda: color_hash(SHORT_STR, min_h=150, max_h=300)
+
+
+@bench("ColorHash/hex")
+def _():
+    return lambda: ColorHash(SHORT_STR).hex
+
+
+@bench("ColorHash/hex_x3")
+def _():
+    def run():
+        c = ColorHash(SHORT_STR)
+        return c.hex, c.hex, c.hex
+
+    return run
+
+
+@bench("ColorHasher/hex")
+def _():
+    hasher = ColorHasher()
+    return lambda: hasher.hex(SHORT_STR)
+
+
+@bench("ColorHasher/hex_bytes")
+def _():
+    hasher = ColorHasher(encoder="bytes")
+    data = SHORT_STR.encode()
+    return lambda: hasher.hex(data)
+
+
+@bench("color_hash_int")
+def _():
+    return lambda: color_hash_int(SHORT_STR)
+
+
+@bench("ColorHasher/hex_table")
+def _():
+    hasher = ColorHasher(table=True)
+    return lambda: hasher.hex(SHORT_STR)
+
+
+@bench("ColorHasher/hex_oklch")
+def _():
+    hasher = ColorHasher(model="oklch")
+    hasher.hex(SHORT_STR)  # build lookup table
+    return lambda: hasher.hex(SHORT_STR)
+
+
+@bench("ColorHasher/hex_frozen")
+def _():
+    hasher = ColorHasher().freeze()
+    return lambda: hasher.hex(SHORT_STR)
+
+
+@bench("ColorHasher/hex_cache")
+def _():
+    hasher = ColorHasher(cache_size=1024)
+    return lambda: hasher.hex(SHORT_STR)
+
+
+@bench("ColorHasher/hex_shared_cache")
+def _():
+    hasher = ColorHasher(shared_cache=True, cache_size=1024)
+    atexit.register(hasher.cache.unlink)
+    return lambda: hasher.hex(SHORT_STR)
+
+
+# ---------------------------------------------------------------------------
+# startup
+# ---------------------------------------------------------------------------
+
+
+@bench("startup/python")
+def _():
+    cmd = [sys.executable, "-c", "pass"]
+    return lambda: subprocess.run(cmd, check=True)
+
+
+@bench("startup/import_colorhash")
+def _():
+    cmd = [sys.executable, "-c", "import colorhash"]
+    return lambda: subprocess.run(cmd, check=True)
+
+
+# ---------------------------------------------------------------------------
+# bulk throughput
+# ---------------------------------------------------------------------------
+
+
+@bench("bulk/ColorHash_hex", n=len(BULK_KEYS))
+def _():
+    return lambda: [ColorHash(key).hex for key in BULK_KEYS]
+
+
+@bench("bulk/ColorHasher_hex_table", n=len(BULK_KEYS))
+def _():
+    hasher = ColorHasher(table=True)
+    return lambda: list(map(hasher.hex, BULK_KEYS))
+
+
+@bench("bulk/color_hash_int_many", n=len(BULK_KEYS))
+def _():
+    import numpy as np  # noqa: F401, PLC0415
+
+    return lambda: color_hash_int_many(BULK_KEYS)
+
+
+@bench("bulk/color_hash_many", n=len(BULK_KEYS))
+def _():
+    import numpy as np  # noqa: F401, PLC0415
+
+    return lambda: hsl2rgb_many(*color_hash_many(BULK_KEYS))
+
+
+@bench("bulk/rgb2hex", n=len(BULK_KEYS))
+def _():
+    rgbs = [ColorHash(key).rgb for key in BULK_KEYS]
+    return lambda: "".join([f"{rgb2hex(rgb)}\n" for rgb in rgbs]).encode("ascii")
+
+
+@bench("bulk/rgb2hex_many", n=len(BULK_KEYS))
+def _():
+    rgbs = [ColorHash(key).rgb for key in BULK_KEYS]
+    return lambda: rgb2hex_many(rgbs)
+
+
+@bench("bulk/rgb2hex_many_array", n=len(BULK_KEYS))
+def _():
+    import numpy as np  # noqa: F401, PLC0415
+
+    packed = color_hash_int_many(BULK_KEYS)
+    return lambda: rgb2hex_many(packed)
+
+
+@bench("bulk/ColorHasher_hex_table_repeated", n=len(REPEATED_KEYS))
+def _():
+    hasher = ColorHasher(table=True)
+    return lambda: list(map(hasher.hex, REPEATED_KEYS))
+
+
+@bench("bulk/color_hash_dedup_repeated", n=len(REPEATED_KEYS))
+def _():
+    return lambda: color_hash_dedup(REPEATED_KEYS, color="hex")
+
+
+@bench("palette/assign_palette_200", n=200)
+def _():
+    keys = BULK_KEYS[:200]
+    return lambda: assign_palette(keys)
+
+
+# ---------------------------------------------------------------------------
+# persistent cache, every call is a new job (new hasher)
+# ---------------------------------------------------------------------------
+
+
+def _run_job(model: str, cache_path: Path | None = None) -> list[str]:
+    hasher = ColorHasher(model=model, cache_path=cache_path)
+    hasher.prefetch(JOB_KEYS)
+    colors = [hasher.hex(key) for key in JOB_KEYS]
+    if cache_path is not None:
+        hasher.cache.close()
+    return colors
+
+
+def _bench_persistent(model: str) -> None:
+    @bench(f"persistent/{model}_no_cache", n=len(JOB_KEYS))
+    def _():
+        return lambda: _run_job(model)
+
+    @bench(f"persistent/{model}_cold", n=len(JOB_KEYS))
+    def _():
+        tmp = tempfile.TemporaryDirectory()
+        counter = itertools.count()
+        # new file every time, "tmp" is kept alive (and removed) with the lambda
+        return lambda: (tmp, _run_job(model, Path(tmp.name) / f"{next(counter)}.db"))
+
+    @bench(f"persistent/{model}_warm", n=len(JOB_KEYS))
+    def _():
+        tmp = tempfile.TemporaryDirectory()
+        path = Path(tmp.name) / "colors.db"
+        _run_job(model, path)
+        return lambda: (tmp, _run_job(model, path))
+
+
+_bench_persistent("hsl")
+_bench_persistent("oklch")
+
+
+# ---------------------------------------------------------------------------
+# streams
+# ---------------------------------------------------------------------------
+
+
+def _big_file() -> tuple[tempfile.TemporaryDirectory, Path]:
+    tmp = tempfile.TemporaryDirectory()
+    path = Path(tmp.name) / "big.bin"
+    path.write_bytes(LONG_STR.encode() * 1600)  # ~17 MB
+    return tmp, path
+
+
+@bench("stream/ColorHash_from_file")
+def _():
+    tmp, path = _big_file()
+    return lambda: (tmp, ColorHash.from_file(path).hex)
+
+
+@bench("stream/ColorHash_read_bytes")
+def _():
+    tmp, path = _big_file()
+    return lambda: (tmp, ColorHash(path.read_bytes(), encoder="bytes").hex)
+
+
+@bench("stream/crc32_hash_stream_chunks", n=100)
+def _():
+    chunks = [LONG_STR.encode()] * 100
+    return lambda: crc32_hash_stream(chunks)
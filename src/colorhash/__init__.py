@@ -1,12 +1,21 @@
-from pathlib import Path
-
 from .colorhash import ColorHash
+from .colorhash import ColorHasher
+from .colorhash import color_hash_dedup
+from .colorhash import color_hash_int
+from .colorhash import color_hash_int_many
+from .colorhash import color_hash_many
+from .colorhash import get_hasher
+from .colorhash import hsl2rgb_many
+from .colorhash import preload
+from .colorhash import register_hashfunc
 
 
 def get_version(_):
     """
     Fast (dev time) way to get version.
     """
+    from pathlib import Path  # noqa: PLC0415
+
     with Path("pyproject.toml").open(encoding="utf-8") as f:
         for line in f:
             if line.startswith("version = "):
@@ -14,17 +23,43 @@ def get_version(_):
     return None
 
 
-try:
-    # py3.8+
-    from importlib.metadata import version
-
-except ImportError:
+def _version(package: str) -> str:
+    """
+    Get installed version, importing (slow) metadata machinery only now.
+    """
     try:
-        # py3.6 - py3.7
-        from importlib_metadata import version
+        # py3.8+
+        from importlib.metadata import version  # noqa: PLC0415
+
     except ImportError:
-        # some installations might be missing importlib_metadata
-        version = get_version
+        try:
+            # py3.6 - py3.7
+            from importlib_metadata import version  # noqa: PLC0415
+        except ImportError:
+            # some installations might be missing importlib_metadata
+            version = get_version
+    return version(package)
+
+
+def __getattr__(name: str):
+    # "__version__" is resolved on first access, not on import (PEP 562)
+    if name == "__version__":
+        value = _version(__package__)
+        globals()["__version__"] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
-__all__ = ["ColorHash"]
-__version__ = version(__package__)
+__all__ = [
+    "ColorHash",
+    "ColorHasher",
+    "color_hash_dedup",
+    "color_hash_int",
+    "color_hash_int_many",
+    "color_hash_many",
+    "get_hasher",
+    "hsl2rgb_many",
+    "preload",
+    "register_hashfunc",
+]
@@ -0,0 +1,202 @@
+"""
+Color lines of text from stdin or files.
+
+Every input line is one key (without the trailing newline), every output line
+is its color. Input is processed in chunks, so memory use stays constant. Lines
+are hashed as raw bytes, so UTF-8 text gets the same colors as ``ColorHash``
+would give to the decoded strings.
+
+    $ printf 'Hello World\\nhey\\n' | python -m colorhash --format tsv
+    Hello World	#2dd24b
+    hey	#782d86
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import IO
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import Sequence
+
+from .colorhash import COLORS
+from .colorhash import HASH_FUNCTIONS
+from .colorhash import HUE_VERSIONS
+from .colorhash import MODELS
+from .colorhash import ColorHasher
+
+# approx. size of input read (and output written) at once
+CHUNK_SIZE = 1 << 20
+FORMATS = ("plain", "tsv", "jsonl")
+
+
+def _floats(value: str) -> tuple[float, ...]:
+    """
+    Parse comma separated floats, eg. "0.35,0.5,0.65".
+    """
+    try:
+        return tuple(float(x) for x in value.split(","))
+    except ValueError as exc:
+        msg = f"expected comma separated floats, got {value!r}"
+        raise argparse.ArgumentTypeError(msg) from exc
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m colorhash",
+        description="Generate color for every line of input.",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=["-"],
+        help="files to read, '-' (default) reads stdin",
+    )
+    parser.add_argument(
+        "-c",
+        "--color",
+        choices=COLORS,
+        default="hex",
+        help="color representation (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default="plain",
+        help="plain prints colors only, tsv and jsonl print keys too "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-l",
+        "--lightness",
+        type=_floats,
+        default=(0.35, 0.5, 0.65),
+        help="comma separated lightness values (default: 0.35,0.5,0.65)",
+    )
+    parser.add_argument(
+        "-s",
+        "--saturation",
+        type=_floats,
+        default=(0.35, 0.5, 0.65),
+        help="comma separated saturation values (default: 0.35,0.5,0.65)",
+    )
+    parser.add_argument(
+        "--hashfunc",
+        choices=tuple(HASH_FUNCTIONS),
+        default="crc32",
+        help="hash function (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--model",
+        choices=tuple(MODELS),
+        default="hsl",
+        help="color model (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--hue-version",
+        type=int,
+        choices=HUE_VERSIONS,
+        default=1,
+        help="hue mapping version (default: %(default)s)",
+    )
+    parser.add_argument("--min-h", type=int, default=None, help="min hue")
+    parser.add_argument("--max-h", type=int, default=None, help="max hue")
+    return parser
+
+
+def _formatter(color: str, fmt: str) -> Callable[[bytes, Any], str]:
+    """
+    Return function making output line from raw key and its ``color`` value.
+    """
+
+    def color_str(value: Any) -> str:
+        if isinstance(value, tuple):
+            return ",".join(map(str, value))
+        return str(value)
+
+    def key_str(key: bytes) -> str:
+        return key.decode("utf-8", errors="replace")
+
+    if fmt == "plain":
+        return lambda _, value: color_str(value)
+    if fmt == "tsv":
+        return lambda key, value: f"{key_str(key)}\t{color_str(value)}"
+    return lambda key, value: json.dumps({"key": key_str(key), color: value})
+
+
+def _read_chunks(files: Sequence[str]) -> Iterator[list[bytes]]:
+    """
+    Yield lists of lines (approx. ``CHUNK_SIZE`` bytes each) from all files.
+    """
+    for path in files:
+        if path == "-":
+            f: IO[bytes] = sys.stdin.buffer
+        else:
+            f = open(path, "rb", buffering=CHUNK_SIZE)  # noqa: SIM115, PTH123
+        try:
+            while True:
+                lines = f.readlines(CHUNK_SIZE)
+                if not lines:
+                    break
+                yield lines
+        finally:
+            if f is not sys.stdin.buffer:
+                f.close()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run command line interface, return exit code.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        hasher = ColorHasher(
+            lightness=args.lightness,
+            saturation=args.saturation,
+            min_h=args.min_h,
+            max_h=args.max_h,
+            table=True,
+            # raw lines get the same colors as decoded ones, without decoding
+            encoder="bytes",
+            hashfunc=args.hashfunc,
+            model=args.model,
+            hue_version=args.hue_version,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    formatter = _formatter(args.color, args.format)
+    color_of = getattr(hasher, args.color)
+    out = sys.stdout
+    try:
+        for lines in _read_chunks(args.files):
+            # "\n" or "\r\n" line endings, other "\r"s are part of the key
+            keys = [
+                (line[:-2] if line[-2:] == b"\r\n" else line[:-1])
+                if line[-1:] == b"\n"
+                else line
+                for line in lines
+            ]
+            out.write(
+                "".join([f"{formatter(key, color_of(key))}\n" for key in keys]),
+            )
+    except BrokenPipeError:
+        # eg. "python -m colorhash < big.log | head", as python docs recommend
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except OSError as exc:
+        # eg. missing file, reported like other command line tools do
+        print(f"colorhash: {exc.filename}: {exc.strerror}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Color batches of objects without blocking asyncio event loop.
+
+>>> import asyncio
+>>> from colorhash.aio import color_hash_batch
+>>> asyncio.run(color_hash_batch(["Hello World", "hey"], color="hex"))
+['#2dd24b', '#782d86']
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+from typing import Sequence
+
+from .colorhash import COLORS
+from .colorhash import ColorHasher
+from .colorhash import get_hasher
+from .parallel import _color_in_worker
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# batches up to this size are colored right away, it takes ~1 ms
+DEFAULT_INLINE_THRESHOLD = 1_000
+DEFAULT_CHUNKSIZE = 5_000
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+@lru_cache(maxsize=32)
+def _worker_hasher(params: tuple) -> ColorHasher:
+    """
+    Return hasher of ``params`` created once per process, to reuse its table.
+    """
+    return ColorHasher(**dict(params))
+
+
+def _color_chunk(hasher: ColorHasher, color: str, chunk: list[Any]) -> list[Any]:
+    return list(map(getattr(hasher, color), chunk))
+
+
+def _color_chunk_in_worker(params: tuple, color: str, chunk: list[Any]) -> list[Any]:
+    # hasher sent to a process would be a fresh copy for every chunk
+    return _color_in_worker(_worker_hasher(params), color, chunk)
+
+
+def _hasher_params(hasher: ColorHasher) -> tuple:
+    """
+    Return all params ``hasher`` is pickled with (including its cache).
+    """
+    factory, _ = hasher.__reduce__()
+    return tuple(sorted(factory.keywords.items()))
+
+
+async def color_hash_batch(  # noqa: PLR0913
+    objs: Iterable[Any],
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    hasher: ColorHasher | None = None,
+    color: str = "hsl",
+    executor: Executor | None = None,
+    inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[Any]:
+    """
+    Calculate colors of ``objs`` without blocking the event loop.
+
+    Small batches (up to ``inline_threshold`` objects) are colored right away.
+    Larger ones are split into chunks colored in ``executor``, at most
+    ``max_concurrency`` chunks at once. The event loop keeps running while
+    chunks are processed.
+
+    Args:
+        objs: objects to color.
+        lightness, saturation, min_h, max_h, hasher: same as for ``ColorHash``.
+        color: one of "hsl", "rgb", "hex" or "rgb_int".
+        executor: thread or process pool. Defaults to the event loop's default
+                  (thread) executor. Threads use ``hasher`` (and its cache) as
+                  it is. With process pool, objects and hasher must be
+                  picklable, every worker creates a hasher of the same params
+                  once.
+        inline_threshold: max batch size colored without executor.
+        chunksize: number of objects sent to executor at once.
+        max_concurrency: max number of chunks processed at once.
+
+    Returns:
+        List of colors, in order of ``objs``.
+    """
+    if color not in COLORS:
+        msg = f"color must be one of {COLORS}"
+        raise ValueError(msg)
+    if chunksize < 1 or max_concurrency < 1:
+        msg = "chunksize and max_concurrency must be >= 1"
+        raise ValueError(msg)
+    hasher = get_hasher(lightness, saturation, min_h, max_h, table=True, hasher=hasher)
+
+    objs = list(objs)
+    if len(objs) <= inline_threshold:
+        return _color_chunk(hasher, color, objs)
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    if isinstance(executor, ProcessPoolExecutor):
+        func, arg = _color_chunk_in_worker, _hasher_params(hasher)
+    else:
+        # threads share the passed hasher (and its cache)
+        func, arg = _color_chunk, hasher
+
+    async def color_chunk(chunk: list[Any]) -> list[Any]:
+        async with semaphore:
+            return await loop.run_in_executor(executor, func, arg, color, chunk)
+
+    chunks = await asyncio.gather(
+        *(color_chunk(objs[i : i + chunksize]) for i in range(0, len(objs), chunksize)),
+    )
+    return [c for chunk in chunks for c in chunk]
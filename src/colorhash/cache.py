@@ -0,0 +1,698 @@
+"""
+Caches for computed colors: in memory, in SQLite database file or in shared
+memory of a host.
+
+>>> from colorhash import ColorHasher
+>>> hasher = ColorHasher(cache_size=1000)
+>>> hasher.hex("Hello World")
+'#2dd24b'
+>>> hasher.cache.cache_info()
+CacheInfo(hits=0, misses=1, maxsize=1000, currsize=1)
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import struct
+import sys
+import weakref
+from array import array
+from binascii import crc32
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+from typing import Hashable
+from typing import Iterable
+from typing import NamedTuple
+from typing import Sequence
+from zlib import adler32
+
+
+class CacheInfo(NamedTuple):
+    """
+    Cache statistics, same as ``functools.lru_cache`` provides.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    Thread-safe mapping keeping only ``maxsize`` least recently used items.
+
+    Args:
+        maxsize: max number of items to keep.
+    """
+
+    __slots__ = ("_data", "_lock", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 0:
+            msg = "maxsize must be >= 0"
+            raise ValueError(msg)
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return cached value for ``key`` (and mark it as recently used).
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store ``value`` for ``key``, evict the least recently used if full.
+        """
+        with self._lock:
+            data = self._data
+            data[key] = value
+            data.move_to_end(key)
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return hits, misses, maxsize and current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        """
+        Remove all items and reset statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# max rows kept per configuration by "SQLiteCache"
+DEFAULT_PERSISTENT_MAXSIZE = 10_000_000
+# max colors "SQLiteCache" keeps in memory
+DEFAULT_MEM_SIZE = 100_000
+# when full, "SQLiteCache" removes this part of rows at once, so that rows are
+# counted again (to see ones written by other processes) only once in a while
+_EVICT_FRACTION = 10
+# marks keys known to be missing in the database (see "SQLiteCache.prefetch()")
+_ABSENT = object()
+# max number of SQL variables per query (SQLite < 3.32 allows only 999)
+_MAX_VARIABLES = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS colors (
+    fp INTEGER NOT NULL,
+    key BLOB NOT NULL,
+    h,
+    s,
+    l,
+    rgb INTEGER NOT NULL,
+    UNIQUE (fp, key)
+)
+"""
+
+
+def fingerprint(params: tuple) -> int:
+    """
+    Return stable 64-bit fingerprint of ``params`` (same in every process).
+
+    >>> fingerprint(((0.5,), (0.5,), 0, 360))
+    8291782255796820347
+    """
+    import hashlib  # noqa: PLC0415
+
+    digest = hashlib.blake2b(repr(params).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _close_at_exit(ref: weakref.ref) -> None:
+    cache = ref()
+    if cache is not None:
+        cache.close()
+
+
+def _evict(conn: Any, fp: int, maxsize: int) -> int:
+    """
+    Remove oldest rows of ``fp`` over ``maxsize`` (inside transaction).
+
+    If there are more, rows are removed down to ``1 / _EVICT_FRACTION`` under
+    ``maxsize``. Returns number of rows left.
+    """
+    # other processes may have written too
+    (count,) = conn.execute(
+        "SELECT COUNT(*) FROM colors WHERE fp = ?",
+        (fp,),
+    ).fetchone()
+    excess = count - maxsize
+    if excess > 0:
+        excess += maxsize // _EVICT_FRACTION
+        conn.execute(
+            "DELETE FROM colors WHERE rowid IN "
+            "(SELECT rowid FROM colors WHERE fp = ? ORDER BY rowid LIMIT ?)",
+            (fp, excess),
+        )
+    return count - max(excess, 0)
+
+
+def _write(
+    conn: Any,
+    rows: list[tuple],
+    fp: int,
+    maxsize: int,
+    count: int | None,
+) -> int | None:
+    """
+    Write and clear pending ``rows`` of ``fp`` in one transaction.
+
+    Oldest rows over ``maxsize`` are removed. ``count`` is number of rows
+    before, if known. Returns number of rows after, if known.
+    """
+    if not rows:
+        return count
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO colors VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        if count is not None:
+            count += max(cursor.rowcount, 0)
+        if count is None or count > maxsize:
+            count = _evict(conn, fp, maxsize)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    rows.clear()
+    return count
+
+
+def _close_db(conn: Any, lock: Lock, rows: list[tuple], fp: int, maxsize: int) -> None:
+    """
+    Write pending ``rows`` and close ``conn``, finalizer of ``SQLiteCache``.
+
+    Runs on ``close()``, when the cache is garbage collected or at exit.
+    """
+    with lock:
+        try:
+            _write(conn, rows, fp, maxsize, None)
+        finally:
+            conn.close()
+
+
+class SQLiteCache:
+    """
+    Thread-safe cache of colors persisted in SQLite database file.
+
+    Colors survive the process, so short-lived jobs coloring the same keys
+    again start warm. The database is in WAL mode, so it can be shared by
+    processes running at once (each has to open its own ``SQLiteCache``).
+
+    New colors are written in batches of ``batch_size`` (and on ``flush()``,
+    ``close()``, when the cache is garbage collected or at exit). Worker
+    processes of ``multiprocessing`` skip the exit handlers, ``flush()`` when
+    done with a batch there. Up to ``mem_size`` recently used colors are kept
+    in memory, so they are not read again. Use ``prefetch()`` to read many
+    keys with one query instead of one query per key.
+
+    Only one configuration (colors of one ``ColorHasher``) is visible through
+    an instance, selected by ``fingerprint``. Many of them can be stored in the
+    same file. Usually it is created by ``ColorHasher(cache_path=...)``.
+
+    Args:
+        path: database file, created if missing.
+        fingerprint: id of configuration, see ``fingerprint()``.
+        maxsize: max number of colors kept for the configuration. Oldest
+                 ones are removed when exceeded (a tenth of them more, so
+                 rows are counted only once in a while).
+        batch_size: number of new colors written at once.
+        mem_size: max number of colors (least recently used) kept in memory.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_conn",
+        "_count",
+        "_finalizer",
+        "_lock",
+        "_mem",
+        "_pending",
+        "batch_size",
+        "fingerprint",
+        "hits",
+        "maxsize",
+        "misses",
+        "path",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        fingerprint: int = 0,
+        maxsize: int = DEFAULT_PERSISTENT_MAXSIZE,
+        batch_size: int = 1000,
+        mem_size: int = DEFAULT_MEM_SIZE,
+    ):
+        if maxsize < 0 or batch_size < 1:
+            msg = "maxsize must be >= 0 and batch_size >= 1"
+            raise ValueError(msg)
+        self.path = os.fspath(path)
+        self.fingerprint: int = fingerprint
+        self.maxsize: int = maxsize
+        self.batch_size: int = batch_size
+        self.hits: int = 0
+        self.misses: int = 0
+        # colors read or computed by this process, or "_ABSENT"
+        self._mem = LRUCache(mem_size)
+        self._open()
+        (self._count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM colors WHERE fp = ?",
+            (fingerprint,),
+        ).fetchone()
+        _SQLITE_CACHES.add(self)
+
+    def _open(self) -> None:
+        import sqlite3  # noqa: PLC0415
+
+        # rows waiting to be written
+        self._pending: list[tuple] = []
+        self._lock = Lock()
+        # autocommit, transactions are started explicitly
+        conn = sqlite3.connect(
+            self.path,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        self._conn = conn
+        # holds no reference to the cache, so it can be garbage collected
+        self._finalizer = weakref.finalize(
+            self,
+            _close_db,
+            conn,
+            self._lock,
+            self._pending,
+            self.fingerprint,
+            self.maxsize,
+        )
+
+    def _reopen(self) -> None:
+        """
+        Open own database connection in forked process.
+
+        Connection of the parent can't be used here, rows pending there are
+        left to it (they would be written twice). Number of rows is inherited.
+        """
+        self._finalizer.detach()
+        self._mem = LRUCache(self._mem.maxsize)
+        self._open()
+
+    def __len__(self) -> int:
+        return self._count + len(self._pending)
+
+    def __enter__(self) -> SQLiteCache:  # noqa: PYI034
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _colors(row: tuple) -> Any:
+        h, s, l, rgb = row  # noqa: E741
+        return (h, s, l), (rgb >> 16, rgb >> 8 & 0xFF, rgb & 0xFF), f"#{rgb:06x}"
+
+    def _connection(self) -> Any:
+        conn = self._conn
+        if conn is None:
+            msg = "cache is closed"
+            raise ValueError(msg)
+        return conn
+
+    def get(self, key: bytes, default: Any = None) -> Any:
+        """
+        Return cached colors of ``key`` (bytes it is hashed from).
+        """
+        with self._lock:
+            conn = self._connection()
+            colors = self._mem.get(key)
+            if colors is None:
+                row = conn.execute(
+                    "SELECT h, s, l, rgb FROM colors WHERE fp = ? AND key = ?",
+                    (self.fingerprint, key),
+                ).fetchone()
+                if row is not None:
+                    colors = self._colors(row)
+                    self._mem.set(key, colors)
+            if colors is None or colors is _ABSENT:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return colors
+
+    def set(self, key: bytes, value: Any) -> None:
+        """
+        Store ``(hsl, rgb, hex)`` colors of ``key``, written on next batch.
+        """
+        (h, s, l), (r, g, b), _ = value  # noqa: E741
+        with self._lock:
+            self._connection()
+            self._mem.set(key, value)
+            self._pending.append((self.fingerprint, key, h, s, l, r << 16 | g << 8 | b))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def prefetch(self, keys: Iterable[bytes]) -> int:
+        """
+        Read colors of many keys at once, return number of them found.
+
+        Later ``get()`` of these keys does not query the database (unless
+        more than ``mem_size`` keys are read).
+        """
+        with self._lock:
+            conn = self._connection()
+            mem = self._mem
+            todo = list({key for key in keys if mem.get(key) is None})
+            found = 0
+            step = _MAX_VARIABLES
+            for i in range(0, len(todo), step):
+                chunk = todo[i : i + step]
+                query = (
+                    "SELECT key, h, s, l, rgb FROM colors WHERE fp = ? AND key IN "
+                    f"({','.join('?' * len(chunk))})"
+                )
+                rows = conn.execute(query, (self.fingerprint, *chunk))
+                missing = set(chunk)
+                for key, *row in rows:
+                    mem.set(key, self._colors(row))
+                    missing.discard(key)
+                    found += 1
+                for key in missing:
+                    mem.set(key, _ABSENT)
+            return found
+
+    def _flush(self) -> None:
+        self._count = _write(
+            self._connection(),
+            self._pending,
+            self.fingerprint,
+            self.maxsize,
+            self._count,
+        )
+
+    def flush(self) -> None:
+        """
+        Write all new colors to the database.
+        """
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """
+        Write new colors and close the database. Safe to call repeatedly, other
+        methods raise ``ValueError`` then.
+        """
+        with self._lock:
+            self._conn = None
+        self._finalizer()
+        _SQLITE_CACHES.discard(self)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return hits, misses, maxsize and number of stored colors.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def cache_clear(self) -> None:
+        """
+        Remove all colors of the configuration and reset statistics.
+        """
+        with self._lock:
+            self._connection().execute(
+                "DELETE FROM colors WHERE fp = ?",
+                (self.fingerprint,),
+            )
+            self._mem.cache_clear()
+            self._pending.clear()
+            self._count = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# open "SQLiteCache"s of this process, see "_reopen_after_fork()"
+_SQLITE_CACHES: weakref.WeakSet[SQLiteCache] = weakref.WeakSet()
+
+
+def _reopen_after_fork() -> None:
+    for cache in list(_SQLITE_CACHES):
+        cache._reopen()  # noqa: SLF001
+
+
+# forked processes (eg. workers of "multiprocessing") inherit open caches
+if hasattr(os, "register_at_fork"):  # not on Windows
+    os.register_at_fork(after_in_child=_reopen_after_fork)
+
+
+# default number of slots of "SharedMemoryCache" (16 bytes each)
+DEFAULT_SHARED_SLOTS = 1 << 20
+# max number of slots tried per key, the cache never grows or moves items
+_MAX_PROBES = 8
+_SHM_MAGIC = b"CHSM"
+_SHM_VERSION = 1
+# magic, version, number of slots, fingerprint of params (padded to 32 bytes)
+_SHM_HEADER = struct.Struct("<4sIQq8x")
+# slot is 2 words: tag of key (0 for empty slot), then index of colors with
+# check of both in upper 32 bits
+_SHM_SLOT_SIZE = 16
+
+
+def _key_tag(key: bytes) -> tuple[int, int]:
+    """
+    Return 32-bit hash of ``key`` (picks slot) and its 64-bit tag (never 0).
+    """
+    h = crc32(key)
+    return h, (h << 32 | adler32(key)) or 1
+
+
+def _slot_check(tag: int, value: int) -> int:
+    return (tag ^ tag >> 32 ^ value ^ 0x5BD1E995) & 0xFFFFFFFF
+
+
+class SharedMemoryCache:
+    """
+    Colors of one lookup table shared by all processes of a host.
+
+    It lives in ``multiprocessing.shared_memory`` (Python 3.8+), so a color
+    computed by one worker is a hit for all others. It is a fixed-size open
+    addressing table of 64-bit key tags (``crc32`` and ``adler32`` of bytes
+    the key is hashed from) and indexes into ``table``.
+
+    Reads take no lock. Writers only fill empty slots: index and check first,
+    then the tag. A slot whose check does not match (being written, or two
+    processes writing at once) is just a miss. When all ``8`` slots tried for
+    a key are full, its color is not stored. Keys with the same 64-bit tag
+    share a color, which is very unlikely even with millions of keys.
+
+    Usually it is created by ``ColorHasher(shared_cache=True)`` in the master
+    process. Forked workers use it as it is, others attach by ``name``.
+    Call ``unlink()`` in the creating process when it is no longer needed.
+
+    Args:
+        table: all possible colors, same in every process.
+        fingerprint: id of configuration, see ``fingerprint()``. Attaching to
+                     a cache of another configuration is an error.
+        name: name of shared memory to attach to, or to create (random if not
+              set).
+        slots: number of slots of a new cache, rounded up to a power of two.
+        create: whether to create new shared memory or attach to existing.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_index",
+        "_mask",
+        "_probes",
+        "_shm",
+        "_table",
+        "_words",
+        "create",
+        "fingerprint",
+        "hits",
+        "maxsize",
+        "misses",
+    )
+
+    def __init__(
+        self,
+        table: Sequence[Any],
+        fingerprint: int = 0,
+        name: str | None = None,
+        slots: int = DEFAULT_SHARED_SLOTS,
+        *,
+        create: bool = True,
+    ):
+        if slots < 1:
+            msg = "slots must be >= 1"
+            raise ValueError(msg)
+        from multiprocessing import shared_memory  # noqa: PLC0415
+
+        if create:
+            slots = 1 << (slots - 1).bit_length()
+            size = _SHM_HEADER.size + slots * _SHM_SLOT_SIZE
+            shm = shared_memory.SharedMemory(name, create=True, size=size)
+            _SHM_HEADER.pack_into(
+                shm.buf,
+                0,
+                _SHM_MAGIC,
+                _SHM_VERSION,
+                slots,
+                fingerprint,
+            )
+        else:
+            shm = _attach(shared_memory, name)
+            magic, version, slots, fp = _SHM_HEADER.unpack_from(shm.buf, 0)
+            if (magic, version, fp) != (_SHM_MAGIC, _SHM_VERSION, fingerprint):
+                shm.close()
+                msg = f"shared memory {name!r} holds colors of other params"
+                raise ValueError(msg)
+
+        self._shm = shm
+        # native byte order, shared memory never leaves the host
+        self._words = shm.buf[_SHM_HEADER.size :].cast("Q")
+        self._mask: int = slots - 1
+        self._probes = range(min(_MAX_PROBES, slots))
+        self._table = table
+        # any index of equal colors will do
+        self._index: dict[Any, int] = {colors: i for i, colors in enumerate(table)}
+        self.create: bool = create
+        self.fingerprint: int = fingerprint
+        self.maxsize: int = slots
+        self.hits: int = 0
+        self.misses: int = 0
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    def __del__(self) -> None:
+        # release view first, memory can't be closed while it exists
+        words = getattr(self, "_words", None)
+        if words is not None:
+            words.release()
+
+    @property
+    def name(self) -> str:
+        """
+        Name of shared memory, to attach from other processes.
+        """
+        return self._shm.name
+
+    def __len__(self) -> int:
+        tags = self._words[::2]
+        return len(tags) - tags.tolist().count(0)
+
+    def get(self, key: bytes, default: Any = None) -> Any:
+        """
+        Return cached colors of ``key`` (bytes it is hashed from).
+        """
+        h, tag = _key_tag(key)
+        words, mask = self._words, self._mask
+        for i in self._probes:
+            pos = ((h + i) & mask) << 1
+            slot_tag = words[pos]
+            if not slot_tag:
+                break
+            if slot_tag == tag:
+                data = words[pos + 1]
+                value = data & 0xFFFFFFFF
+                if data >> 32 != _slot_check(tag, value) or value >= len(self._table):
+                    break
+                self.hits += 1
+                return self._table[value]
+        self.misses += 1
+        return default
+
+    def set(self, key: bytes, value: Any) -> None:
+        """
+        Store colors of ``key`` (an item of ``table``) into first empty slot.
+        """
+        idx = self._index[value]
+        h, tag = _key_tag(key)
+        words, mask = self._words, self._mask
+        for i in self._probes:
+            pos = ((h + i) & mask) << 1
+            slot_tag = words[pos]
+            if slot_tag == tag:
+                return
+            if not slot_tag:
+                # tag last, readers skip the slot until it is complete
+                words[pos + 1] = _slot_check(tag, idx) << 32 | idx
+                words[pos] = tag
+                return
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return hits, misses (of this process), number of slots and used ones.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def cache_clear(self) -> None:
+        """
+        Empty all slots (for all processes) and reset statistics.
+        """
+        words = self._words
+        words[:] = array("Q", bytes(words.nbytes))
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """
+        Detach from shared memory (in this process). Safe to call repeatedly.
+        """
+        self._words.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Free shared memory, once all processes have closed it.
+        """
+        self._shm.unlink()
+
+
+def _attach(shared_memory: Any, name: str | None) -> Any:
+    """
+    Attach to existing shared memory, it is freed by its creator only.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    if os.name != "posix":
+        return shared_memory.SharedMemory(name)
+
+    # up to 3.12 attaching registers it to resource tracker too, which frees it
+    # on exit. Workers share tracker of their parent (where it is registered
+    # already), only a tracker started by now has to forget it.
+    from multiprocessing import resource_tracker  # noqa: PLC0415
+
+    tracker_running = resource_tracker._resource_tracker._fd is not None  # noqa: SLF001
+    shm = shared_memory.SharedMemory(name)
+    if not tracker_running:
+        resource_tracker.unregister(shm._name, "shared_memory")  # noqa: SLF001
+    return shm
@@ -18,15 +18,75 @@ Quick start:
 
 from __future__ import annotations
 
+import math
+import operator
+import os
+import sys
+from array import array
 from binascii import crc32
+from functools import lru_cache
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Mapping
+from typing import NamedTuple
 from typing import Sequence
+from typing import Tuple
 from typing import Union
+from zlib import adler32
+
+from .cache import DEFAULT_PERSISTENT_MAXSIZE
+from .cache import DEFAULT_SHARED_SLOTS
+from .cache import LRUCache
+from .cache import SharedMemoryCache
+from .cache import SQLiteCache
+from .cache import fingerprint
+
+if TYPE_CHECKING:
+    import numpy as np
 
 MIN_HUE = 0
 MAX_HUE = 360
+# versions of mapping hash values to hues, see "_hues()"
+HUE_VERSIONS = (1, 2)
 
 IntOrFloat = Union[int, float]
+# "(hsl, rgb, hex)" of one color
+Colors = Tuple[Tuple[float, float, float], Tuple[int, int, int], str]
+# color representations, names of "ColorHasher" methods
+COLORS = ("hsl", "rgb", "hex", "rgb_int")
+# equal objects of these exact types have equal "str()", so they can be
+# deduplicated as they are (unlike eg. "0.0 == -0.0" or "(1,) == (1.0,)")
+_PLAIN_KEY_TYPES = frozenset({str, bytes, int})
+
+
+class DedupResult(NamedTuple):
+    """
+    Colors of a batch, where each distinct object was colored only once.
+
+    Attributes:
+        colors: color of every object, in order of input.
+        keys: distinct objects, in order of first appearance.
+        key_colors: color of each of ``keys``.
+        codes: index into ``keys`` (and ``key_colors``) of every object.
+    """
+
+    colors: list[Any]
+    keys: list[Any]
+    key_colors: list[Any]
+    codes: list[int]
+
+    @property
+    def dedup_ratio(self) -> float:
+        """
+        Number of objects per distinct one, ``1.0`` if there are no duplicates.
+        """
+        return len(self.codes) / len(self.keys) if self.keys else 1.0
 
 
 def crc32_hash(obj: Any) -> int:
@@ -42,6 +102,396 @@ def crc32_hash(obj: Any) -> int:
     return crc32(bs) & 0xFFFFFFFF
 
 
+def crc32_hash_bytes(data: bytes | bytearray | memoryview) -> int:
+    """
+    Generate a hash for bytes-like ``data``.
+
+    The buffer is passed to CRC-32 as it is, without ``str()`` and encoding.
+    So hash of UTF-8 encoded string is the same as ``crc32_hash()`` of that
+    string, but hash of bytes differs from ``crc32_hash()`` of the same bytes
+    (which hashes their ``repr``, eg. ``"b'abc'"``).
+
+    >>> crc32_hash_bytes("hey".encode()) == crc32_hash("hey")
+    True
+    >>> crc32_hash_bytes(b"hey") == crc32_hash(b"hey")
+    False
+    """
+    return crc32(data) & 0xFFFFFFFF
+
+
+def crc32_hash_stream(chunks: Iterable[bytes | bytearray | memoryview]) -> int:
+    """
+    Generate a hash for bytes-like ``chunks``, as if they were joined.
+
+    Chunks are fed to CRC-32 one by one, so memory use does not depend on
+    total size. UTF-8 encoded chunks of a string give the same hash as
+    ``crc32_hash()`` of the whole string.
+
+    >>> crc32_hash_stream([b"Hello ", b"World"]) == crc32_hash("Hello World")
+    True
+    """
+    value = 0
+    for chunk in chunks:
+        value = crc32(chunk, value)
+    return value & 0xFFFFFFFF
+
+
+def _adler32_hash_bytes(data: bytes | bytearray | memoryview) -> int:
+    return adler32(data) & 0xFFFFFFFF
+
+
+def _blake2b_hash_bytes(data: bytes | bytearray | memoryview) -> int:
+    # imported here, so "import colorhash" doesn't pay for loading OpenSSL
+    from hashlib import blake2b  # noqa: PLC0415
+
+    # 32 bits, like other hashes (fits numpy int64 in batch functions)
+    return int.from_bytes(blake2b(data, digest_size=4).digest(), "big")
+
+
+# named hash functions of bytes-like data, returning unsigned 32-bit ints
+HASH_FUNCTIONS: dict[str, Callable[[bytes | bytearray | memoryview], int]] = {
+    # default, fast, same colors as always
+    "crc32": crc32_hash_bytes,
+    # faster, but spreads short keys poorly
+    "adler32": _adler32_hash_bytes,
+    # slower, best spread over whole color space
+    "blake2b": _blake2b_hash_bytes,
+}
+
+
+def _adler32_hash_stream(chunks: Iterable[bytes | bytearray | memoryview]) -> int:
+    value = 1
+    for chunk in chunks:
+        value = adler32(chunk, value)
+    return value & 0xFFFFFFFF
+
+
+def _blake2b_hash_stream(chunks: Iterable[bytes | bytearray | memoryview]) -> int:
+    from hashlib import blake2b  # noqa: PLC0415
+
+    digest = blake2b(digest_size=4)
+    for chunk in chunks:
+        digest.update(chunk)
+    return int.from_bytes(digest.digest(), "big")
+
+
+# same hash functions fed chunk by chunk, see "crc32_hash_stream()"
+HASH_STREAM_FUNCTIONS: dict[
+    str,
+    Callable[[Iterable[bytes | bytearray | memoryview]], int],
+] = {
+    "crc32": crc32_hash_stream,
+    "adler32": _adler32_hash_stream,
+    "blake2b": _blake2b_hash_stream,
+}
+# these don't keep chunks, so files are read into one reused buffer for them
+_BUFFER_STREAM_FUNCTIONS = frozenset(HASH_STREAM_FUNCTIONS.values())
+
+
+def register_hashfunc(
+    name: str,
+    func: Callable[[bytes | bytearray | memoryview], int],
+    stream_func: Callable[[Iterable[bytes | bytearray | memoryview]], int]
+    | None = None,
+) -> None:
+    """
+    Add hash function usable as ``hashfunc=name``.
+
+    ``func`` takes bytes-like data and has to return a deterministic unsigned
+    32-bit int. Register it on import of your module, so it is also available
+    in worker processes (see ``colorhash.parallel``).
+
+    ``stream_func`` (optional) takes an iterable of bytes-like chunks and
+    returns the same as ``func`` of them joined. Chunks of files are new
+    objects, so it may keep them. Without it, the hash function can't color
+    streams (``ColorHash.from_stream()``).
+    """
+    if name in HASH_FUNCTIONS:
+        msg = f"hash function {name!r} is already registered"
+        raise ValueError(msg)
+    HASH_FUNCTIONS[name] = func
+    if stream_func is not None:
+        HASH_STREAM_FUNCTIONS[name] = stream_func
+
+
+# read files in blocks of this size, see "ColorHash.from_file()"
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _file_chunks(
+    path: str | os.PathLike,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    reuse_buffer: bool = False,
+) -> Iterator[bytes | memoryview]:
+    """
+    Yield contents of file in chunks of (up to) ``chunk_size`` bytes.
+
+    With ``reuse_buffer``, they are read into one buffer, so every chunk is
+    valid only until the next one is read.
+    """
+    # unbuffered, so reads go to our buffer (or new chunk) directly
+    with open(path, "rb", buffering=0) as f:  # noqa: PTH123
+        if not reuse_buffer:
+            yield from iter(partial(f.read, chunk_size), b"")
+            return
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            yield view[:n]
+
+
+def _encode_str(obj: Any) -> bytes:
+    return str(obj).encode("utf-8")
+
+
+def _encode_bytes(obj: bytes | bytearray | memoryview) -> bytes:
+    # hashable copy, used only for cache keys
+    return obj if isinstance(obj, bytes) else bytes(obj)
+
+
+# items of big containers are converted in blocks of this many
+_CANONICAL_BLOCK = 1024
+# text is hashed once this many chars are collected
+_CANONICAL_FLUSH = 1 << 16
+
+
+def _write_container(obj: Any, write: Callable[[str], Any], active: set[int]) -> None:
+    """
+    Write canonical text of built-in container ``obj``.
+
+    ``active`` holds ids of containers being written, a container found in
+    itself is written as ``repr()`` does it (eg. ``[...]``).
+    """
+    key = id(obj)
+    if key in active:
+        write(_RECURSIVE_TEXTS[obj.__class__])
+        return
+    active.add(key)
+    try:
+        _CANONICAL_CONTAINERS[obj.__class__](obj, write, active)
+    finally:
+        active.discard(key)
+
+
+def _item_text(obj: Any, active: set[int]) -> str:
+    """
+    Return canonical ``repr`` of container item.
+    """
+    if obj.__class__ not in _CANONICAL_TYPES:
+        return repr(obj)
+    parts: list[str] = []
+    _write_container(obj, parts.append, active)
+    return "".join(parts)
+
+
+def _item_texts(items: list[Any], active: set[int]) -> Iterable[str]:
+    """
+    Return canonical ``repr`` of all ``items``.
+    """
+    if _CANONICAL_TYPES.isdisjoint(map(type, items)):
+        # no nested containers, plain "repr" is canonical
+        return map(repr, items)
+    return [_item_text(item, active) for item in items]
+
+
+def _write_items(
+    items: Iterable[Any],
+    write: Callable[[str], Any],
+    active: set[int],
+) -> None:
+    """
+    Write canonical ``repr`` of ``items`` separated by ``", "``, in blocks.
+    """
+    items = iter(items)
+    block = list(islice(items, _CANONICAL_BLOCK))
+    while block:
+        write(", ".join(_item_texts(block, active)))
+        block = list(islice(items, _CANONICAL_BLOCK))
+        if block:
+            write(", ")
+
+
+def _write_sorted(
+    items: Iterable[Any],
+    write: Callable[[str], Any],
+    active: set[int],
+) -> None:
+    """
+    Write canonical ``repr`` of ``items`` sorted, separated by ``", "``.
+    """
+    texts = sorted(_item_texts(list(items), active))
+    for i in range(0, len(texts), _CANONICAL_BLOCK):
+        if i:
+            write(", ")
+        write(", ".join(texts[i : i + _CANONICAL_BLOCK]))
+
+
+def _write_tuple(obj: tuple, write: Callable[[str], Any], active: set[int]) -> None:
+    write("(")
+    _write_items(obj, write, active)
+    write(",)" if len(obj) == 1 else ")")
+
+
+def _write_list(obj: list, write: Callable[[str], Any], active: set[int]) -> None:
+    write("[")
+    _write_items(obj, write, active)
+    write("]")
+
+
+def _write_dict(obj: dict, write: Callable[[str], Any], active: set[int]) -> None:
+    # sorted by key, equal dicts are the same whatever order of insertion
+    keys = list(_item_texts(list(obj), active))
+    values = list(_item_texts(list(obj.values()), active))
+    items = sorted(zip(keys, values), key=itemgetter(0))
+    write("{")
+    for i in range(0, len(items), _CANONICAL_BLOCK):
+        if i:
+            write(", ")
+        block = items[i : i + _CANONICAL_BLOCK]
+        write(", ".join([f"{key}: {value}" for key, value in block]))
+    write("}")
+
+
+def _write_set(obj: set, write: Callable[[str], Any], active: set[int]) -> None:
+    if not obj:
+        write("set()")
+        return
+    write("{")
+    _write_sorted(obj, write, active)
+    write("}")
+
+
+def _write_frozenset(
+    obj: frozenset,
+    write: Callable[[str], Any],
+    active: set[int],
+) -> None:
+    if not obj:
+        write("frozenset()")
+        return
+    write("frozenset({")
+    _write_sorted(obj, write, active)
+    write("})")
+
+
+# built-in containers (not subclasses) with canonical text
+_CANONICAL_CONTAINERS: dict[
+    type,
+    Callable[[Any, Callable[[str], Any], set[int]], None],
+] = {
+    tuple: _write_tuple,
+    list: _write_list,
+    dict: _write_dict,
+    set: _write_set,
+    frozenset: _write_frozenset,
+}
+_CANONICAL_TYPES = frozenset(_CANONICAL_CONTAINERS)
+_SEQUENCE_TYPES = frozenset({tuple, list})
+# text of container found in itself, same as "repr()" writes
+_RECURSIVE_TEXTS = {
+    tuple: "(...)",
+    list: "[...]",
+    dict: "{...}",
+    set: "set(...)",
+    frozenset: "frozenset(...)",
+}
+
+
+def _is_plain(obj: Any) -> bool:
+    """
+    Return whether ``str(obj)`` is canonical and small.
+    """
+    cls = obj.__class__
+    if cls not in _CANONICAL_TYPES:
+        return True
+    return (
+        cls in _SEQUENCE_TYPES
+        and len(obj) <= _CANONICAL_BLOCK
+        and _CANONICAL_TYPES.isdisjoint(map(type, obj))
+    )
+
+
+def _encode_canonical(obj: Any) -> bytes:
+    if _is_plain(obj):
+        return str(obj).encode("utf-8")
+    parts: list[str] = []
+    _write_container(obj, parts.append, set())
+    return "".join(parts).encode("utf-8")
+
+
+class _Crc32Writer:
+    """
+    Running CRC-32 of written text, keeping only a small part of it.
+    """
+
+    __slots__ = ("_parts", "_size", "value")
+
+    def __init__(self):
+        self._parts: list[str] = []
+        self._size = 0
+        self.value = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= _CANONICAL_FLUSH:
+            self.flush()
+
+    def flush(self) -> None:
+        self.value = crc32("".join(self._parts).encode("utf-8"), self.value)
+        self._parts.clear()
+        self._size = 0
+
+
+def crc32_hash_canonical(obj: Any) -> int:
+    """
+    Generate a hash for ``obj``, stable for built-in containers.
+
+    Same as ``crc32_hash()``, but items of sets, frozensets and dicts (also
+    nested in tuples and lists) are sorted by their ``repr``. So equal
+    containers have the same hash in every process, whatever order of
+    insertion or string hashing. Other objects hash the same as with
+    ``crc32_hash()``. Text of big containers is fed to CRC-32 in blocks as it
+    is built, never as one string.
+
+    >>> crc32_hash_canonical({"b": 1, "a": 2}) == crc32_hash({"a": 2, "b": 1})
+    True
+    >>> crc32_hash_canonical(("a", 1)) == crc32_hash(("a", 1))
+    True
+    """
+    if _is_plain(obj):
+        return crc32(str(obj).encode("utf-8")) & 0xFFFFFFFF
+    writer = _Crc32Writer()
+    _write_container(obj, writer.write, set())
+    writer.flush()
+    return writer.value & 0xFFFFFFFF
+
+
+# how objects turn into hashed bytes (and cache keys)
+ENCODERS = {
+    "str": _encode_str,
+    "bytes": _encode_bytes,
+    "canonical": _encode_canonical,
+}
+
+
+def _object_hash_function(encoder: str, hashfunc: str) -> Callable[[Any], int]:
+    """
+    Return function hashing objects with given encoder and hash function.
+    """
+    func = HASH_FUNCTIONS[hashfunc]
+    if encoder == "bytes":
+        return func
+    if func is crc32_hash_bytes:
+        return crc32_hash_canonical if encoder == "canonical" else crc32_hash
+    encode = ENCODERS[encoder]
+    return lambda obj: func(encode(obj))
+
+
 def hue_to_rgb(p: float, q: float, t: float):
     """
     Converts hue to RGB component for HSL to RGB color conversion.
@@ -73,7 +523,7 @@ def hue_to_rgb(p: float, q: float, t: float):
     return p
 
 
-def hsl2rgb(hsl: tuple[float, float, float]) -> tuple[int, int, int]:
+def hsl2rgb_float(hsl: tuple[float, float, float]) -> tuple[int, int, int]:
     """
     Converts an HSL color value to its corresponding RGB representation.
 
@@ -88,6 +538,9 @@ def hsl2rgb(hsl: tuple[float, float, float]) -> tuple[int, int, int]:
     Note:
         The hue value should be in degrees (0-360), while saturation and lightness
         should be in the range 0 to 1.
+
+        This is the floating point reference implementation, ``hsl2rgb()``
+        gives the same results (faster, for integer hues).
     """
     h, s, l = hsl  # noqa: E741
     h /= MAX_HUE
@@ -101,33 +554,325 @@ def hsl2rgb(hsl: tuple[float, float, float]) -> tuple[int, int, int]:
     return r, g, b
 
 
+# ramp value exactly this close to ".5" is left to float code, which rounds it
+_TIE_TOLERANCE = 10**9
+# ramp index of a color channel for every integer hue (in degrees)
+_RAMP_INDEX = tuple(
+    d if d < 60 else 60 if d < 180 else 240 - d if d < 240 else 0  # noqa: PLR2004
+    for d in range(MAX_HUE)
+)
+
+
+@lru_cache(maxsize=1024)
+def _hue_ramp(s: float, l: float) -> tuple[int | None, ...]:  # noqa: E741
+    """
+    Return RGB channel values for ramp indexes 0..60 of saturation and lightness.
+
+    Channel rises from ``p`` (index 0) to ``q`` (index 60) over 60 degrees of
+    hue. Values are computed exactly, in integers, from exact ratios of ``s``
+    and ``l``. Values too close to a rounding tie are ``None``.
+    """
+    s_num, s_den = float(s).as_integer_ratio()
+    l_num, l_den = float(l).as_integer_ratio()
+    # p and q as in "hsl2rgb_float()", over common denominator "s_den * l_den"
+    if l < 0.5:  # noqa: PLR2004
+        q = l_num * (s_den + s_num)
+    else:
+        q = l_num * s_den + s_num * l_den - l_num * s_num
+    p = 2 * l_num * s_den - q
+    den = 60 * s_den * l_den
+
+    ramp = []
+    for i in range(61):
+        value, rem = divmod(255 * (60 * p + (q - p) * i), den)
+        if abs(2 * rem - den) * _TIE_TOLERANCE < den:
+            ramp.append(None)
+        else:
+            ramp.append(value + (2 * rem > den))
+    return tuple(ramp)
+
+
+def hsl2rgb(hsl: tuple[float, float, float]) -> tuple[int, int, int]:
+    """
+    Converts an HSL color value to its corresponding RGB representation.
+
+    Integer hues (as ``color_hash()`` gives without ``min_h``/``max_h``) are
+    converted using integer arithmetic only, other hues by ``hsl2rgb_float()``.
+    Results are the same.
+
+    >>> hsl2rgb((131, 0.65, 0.5))
+    (45, 210, 75)
+    """
+    h, s, l = hsl  # noqa: E741
+    if h.__class__ is not int or not 0 <= h < MAX_HUE:
+        return hsl2rgb_float(hsl)
+
+    ramp = _hue_ramp(s, l)
+    r = ramp[_RAMP_INDEX[(h + 120) % MAX_HUE]]
+    g = ramp[_RAMP_INDEX[h]]
+    b = ramp[_RAMP_INDEX[(h + 240) % MAX_HUE]]
+    if r is None or g is None or b is None:
+        # float rounding error decides, like in "hsl2rgb_float()"
+        return hsl2rgb_float(hsl)
+    return r, g, b
+
+
+# chroma of "saturation=1.0" in OKLCH model, same as "100%" in CSS "oklch()"
+OKLCH_MAX_CHROMA = 0.4
+# max error of linear sRGB values still considered inside of gamut
+_GAMUT_EPSILON = 1e-6
+
+
+def _oklab_to_linear_srgb(
+    lightness: float,
+    a: float,
+    b: float,
+) -> tuple[float, float, float]:
+    """
+    Convert OKLab color to linear sRGB (see https://bottosson.github.io/posts/oklab/).
+    """
+    l_ = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m_ = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s_ = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    return (
+        4.0767416621 * l_ - 3.3077115913 * m_ + 0.2309699292 * s_,
+        -1.2684380046 * l_ + 2.6097574011 * m_ - 0.3413193965 * s_,
+        -0.0041960863 * l_ - 0.7034186147 * m_ + 1.7076147010 * s_,
+    )
+
+
+def _in_gamut(rgb: tuple[float, float, float]) -> bool:
+    return all([-_GAMUT_EPSILON <= x <= 1 + _GAMUT_EPSILON for x in rgb])  # noqa: C419
+
+
+def _srgb_byte(x: float) -> int:
+    """
+    Gamma-encode linear sRGB value into 0-255 range.
+    """
+    x = min(max(x, 0.0), 1.0)
+    x = 12.92 * x if x <= 0.0031308 else 1.055 * x ** (1 / 2.4) - 0.055  # noqa: PLR2004
+    return round(x * 255)
+
+
+def oklch2rgb(lch: tuple[float, float, float]) -> tuple[int, int, int]:
+    """
+    Converts an OKLCH color value to its corresponding RGB representation.
+
+    Colors outside of sRGB gamut are mapped into it by reducing chroma, so
+    lightness and hue are kept.
+
+    Args:
+        lch: lightness (0-1), chroma (0-0.4) and hue (0-360) tuple, same as
+             CSS ``oklch()`` takes.
+
+    >>> oklch2rgb((0.628, 0.2577, 29.23))
+    (255, 0, 0)
+    """
+    lightness, chroma, hue = lch
+    rad = math.radians(hue)
+    cos_h, sin_h = math.cos(rad), math.sin(rad)
+    rgb = _oklab_to_linear_srgb(lightness, chroma * cos_h, chroma * sin_h)
+    if not _in_gamut(rgb):
+        # binary search of max chroma in gamut, 2**-16 of chroma is precise enough
+        low, high = 0.0, chroma
+        for _ in range(16):
+            mid = (low + high) / 2
+            if _in_gamut(_oklab_to_linear_srgb(lightness, mid * cos_h, mid * sin_h)):
+                low = mid
+            else:
+                high = mid
+        rgb = _oklab_to_linear_srgb(lightness, low * cos_h, low * sin_h)
+    r, g, b = rgb
+    return _srgb_byte(r), _srgb_byte(g), _srgb_byte(b)
+
+
+def _linear_srgb(x: int) -> float:
+    """
+    Gamma-decode 0-255 sRGB value into linear one (0-1).
+    """
+    c = x / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4  # noqa: PLR2004
+
+
+def rgb2oklab(rgb: tuple[int, int, int]) -> tuple[float, float, float]:
+    """
+    Converts an RGB color value to OKLab ``(L, a, b)``.
+
+    Euclidean distance of OKLab colors is their perceptual difference.
+
+    >>> [round(x, 3) for x in rgb2oklab((255, 0, 0))]
+    [0.628, 0.225, 0.126]
+    """
+    r, g, b = (_linear_srgb(x) for x in rgb)
+    l_ = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m_ = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s_ = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def _oklch_model2rgb(hsl: tuple[float, float, float]) -> tuple[int, int, int]:
+    """
+    Convert color picked in OKLCH model, ie. ``(hue, chroma / 0.4, lightness)``.
+    """
+    h, s, l = hsl  # noqa: E741
+    return oklch2rgb((l, s * OKLCH_MAX_CHROMA, h))
+
+
+# color models, ie. how picked "(h, s, l)" values are converted to RGB
+MODELS: dict[str, Callable[[tuple[float, float, float]], tuple[int, int, int]]] = {
+    "hsl": hsl2rgb,
+    "oklch": _oklch_model2rgb,
+}
+
+
+# two hex digits of every byte value, dict (unlike list) rejects negative ones,
+# but takes anything hashing like a small int (so it is used for ints only)
+_HEX = {i: f"{i:02x}" for i in range(256)}
+_HEX_BYTES = {i: x.encode("ascii") for i, x in _HEX.items()}
+
+
+def _rgb_ints(r: Any, g: Any, b: Any) -> tuple[int, int, int]:
+    """
+    Return integer RGB values (eg. numpy ones) as ints, ``TypeError`` for
+    floats and bools.
+    """
+    if isinstance(r, bool) or isinstance(g, bool) or isinstance(b, bool):
+        msg = "RGB values must be integers"
+        raise TypeError(msg)
+    return operator.index(r), operator.index(g), operator.index(b)
+
+
 def rgb2hex(rgb: tuple[int, int, int]) -> str:
     """
     Format an RGB color value into a hexadecimal color string.
 
+    Values are not checked, only floats and other non-integers raise
+    ``ValueError`` (see ``rgb2hex_many()`` for a checked version).
+
     >>> rgb2hex((255, 0, 0))
     '#ff0000'
     """
+    try:
+        r, g, b = rgb
+        if r.__class__ is int and g.__class__ is int and b.__class__ is int:
+            return "#" + _HEX[r] + _HEX[g] + _HEX[b]
+    except (KeyError, TypeError, ValueError):
+        pass
+    # anything else (eg. numpy ints or values out of range) formatted as always
     try:
         return "#{:02x}{:02x}{:02x}".format(*rgb)
     except TypeError as exc:
         raise ValueError(rgb) from exc
 
 
-def color_hash(
-    obj: Any,
-    lightness: Sequence[float] = (0.35, 0.5, 0.65),
-    saturation: Sequence[float] = (0.35, 0.5, 0.65),
-    min_h: int | None = None,
-    max_h: int | None = None,
-) -> tuple[float, float, float]:
+def rgb2hex_many(
+    rgbs: Iterable[tuple[int, int, int]] | np.ndarray,
+    sep: bytes = b"\n",
+) -> bytearray:
     """
-    Calculate the color for the given object.
+    Format many RGB color values into one buffer of ASCII hex strings.
 
-    This function takes the same arguments as the ``ColorHash`` class.
+    Every color is written as ``#rrggbb`` followed by ``sep``, no string is
+    created per color. Result can be written to a file (eg. CSV column) as it
+    is. Numpy arrays, either ``(N, 3)`` RGB values or ``N`` packed ``0xRRGGBB``
+    integers (eg. from ``color_hash_int_many()``), are encoded at once into a
+    preallocated buffer.
 
-    Returns:
-        A ``(H, S, L)`` tuple.
+    Unlike ``rgb2hex()``, values are checked: they must be integers (not bools)
+    in range 0-255, otherwise ``ValueError`` is raised.
+
+    >>> rgb2hex_many([(255, 0, 0), (45, 210, 75)])
+    bytearray(b'#ff0000\\n#2dd24b\\n')
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(rgbs, np.ndarray):
+        return _rgb2hex_many_array(rgbs, sep)
+
+    table = _HEX_BYTES
+    out = bytearray()
+    try:
+        for r, g, b in rgbs:
+            if (
+                r.__class__ is not int
+                or g.__class__ is not int
+                or b.__class__ is not int
+            ):
+                r, g, b = _rgb_ints(r, g, b)  # noqa: PLW2901
+            out += b"#"
+            out += table[r]
+            out += table[g]
+            out += table[b]
+            out += sep
+    except (KeyError, TypeError) as exc:
+        msg = f"invalid RGB value in {rgbs!r}"
+        raise ValueError(msg) from exc
+    return out
+
+
+def _rgb2hex_many_array(rgbs: np.ndarray, sep: bytes) -> bytearray:
+    """
+    Numpy version of ``rgb2hex_many()``.
+    """
+    np = _import_numpy()
+    if rgbs.ndim == 2 and rgbs.shape[1] == 3:  # noqa: PLR2004
+        packed = rgbs.astype(np.int64) @ np.array([1 << 16, 1 << 8, 1])
+        max_value = 0xFF
+    elif rgbs.ndim == 1:
+        packed = rgbs.astype(np.int64)
+        max_value = 0xFFFFFF
+    else:
+        msg = "expected array of shape (N, 3) or (N,)"
+        raise ValueError(msg)
+    if rgbs.size and not (rgbs.min() >= 0 and rgbs.max() <= max_value):
+        msg = "RGB values out of range"
+        raise ValueError(msg)
+
+    digits = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+    width = 7 + len(sep)
+    out = bytearray(len(packed) * width)
+    # writable view of "out", so it is filled in place
+    view = np.frombuffer(out, dtype=np.uint8).reshape(-1, width)
+    view[:, 0] = ord("#")
+    for i in range(6):
+        view[:, 1 + i] = digits[(packed >> (20 - 4 * i)) & 0xF]
+    if sep:
+        view[:, 7:] = np.frombuffer(sep, dtype=np.uint8)
+    return out
+
+
+def rgb2int(rgb: tuple[int, int, int]) -> int:
+    """
+    Pack an RGB color value into a single 24-bit integer (``0xRRGGBB``).
+
+    >>> hex(rgb2int((255, 0, 0)))
+    '0xff0000'
+    """
+    r, g, b = rgb
+    return r << 16 | g << 8 | b
+
+
+def int2hex(value: int) -> str:
+    """
+    Format a packed RGB color value (``0xRRGGBB``) into a hexadecimal string.
+
+    >>> int2hex(0xFF0000)
+    '#ff0000'
+    """
+    return f"#{value:06x}"
+
+
+def _validate_params(
+    lightness: Sequence[float],
+    saturation: Sequence[float],
+    min_h: int | None,
+    max_h: int | None,
+) -> tuple[int | None, int | None]:
+    """
+    Validate color params and return normalized ``(min_h, max_h)``.
     """
     # "all([x for x ...])" is actually faster than "all(x for x ...)"
     if not all([0.0 <= x <= 1.0 for x in lightness]):  # noqa: C419
@@ -142,23 +887,938 @@ def color_hash(
     if min_h is not None and max_h is None:
         max_h = MAX_HUE
 
-    hash_val = crc32_hash(obj)
-    h = hash_val % 359
-    if min_h is not None and max_h is not None:
-        if not (
+    if (
+        min_h is not None
+        and max_h is not None
+        and not (
             MIN_HUE <= min_h <= MAX_HUE
             and MIN_HUE <= max_h <= MAX_HUE
             and min_h <= max_h
+        )
+    ):
+        msg: str = "min_h and max_h must be in range [0, 360] with min_h <= max_h"
+        raise ValueError(msg)
+
+    return min_h, max_h
+
+
+def _hues(
+    min_h: int | None,
+    max_h: int | None,
+    hue_version: int,
+) -> tuple[tuple[float, ...], int]:
+    """
+    Return all hues to pick from and divisor of hash value after picking one.
+
+    Version 1 (original) picks from 359 hues (0-358), squeezed into the first
+    ~third of ``[min_h, max_h]`` range (if set), as float. Version 2 spreads
+    integer hues evenly over the whole range (0-359 by default).
+    """
+    if hue_version == 1:
+        if min_h is None or max_h is None:
+            return tuple(range(359)), 360
+        span = max_h - min_h
+        # keep "(h / 1000) * span" instead of "h * scale", so floats are same
+        return tuple((h / 1000) * span + min_h for h in range(359)), 360
+
+    if min_h is None or max_h is None:
+        min_h, max_h = MIN_HUE, MAX_HUE
+    min_h, max_h = int(min_h), int(max_h)
+    # both ends included, but 0 and 360 is the same hue
+    n_hues = min(max_h - min_h + 1, MAX_HUE)
+    return tuple(range(min_h, min_h + n_hues)), n_hues
+
+
+class _FrozenTable:
+    """
+    Lookup table of colors packed into arrays and one string.
+
+    Unlike a list of tuples, it holds no Python objects per color, so reading
+    it does not write reference counts (except of few containers). Pages of a
+    table built before fork stay shared by all forked processes. Colors are
+    unpacked on every access.
+    """
+
+    __slots__ = ("_hex", "_hues", "_lightness", "_n_l", "_n_sl", "_rgb", "_saturation")
+
+    def __init__(
+        self,
+        hues: Sequence[float],
+        saturation: Sequence[float],
+        lightness: Sequence[float],
+        table: Sequence[Colors],
+    ):
+        is_int = all(isinstance(h, int) for h in hues)
+        self._hues = array("l" if is_int else "d", hues)
+        self._saturation = array("d", saturation)
+        self._lightness = array("d", lightness)
+        self._n_l = len(lightness)
+        self._n_sl = len(saturation) * len(lightness)
+        self._rgb = array("I", [rgb2int(rgb) for _, rgb, _ in table])
+        # "#rrggbb" of every color, 7 chars each
+        self._hex = "".join([hex_ for _, _, hex_ in table])
+
+    def __len__(self) -> int:
+        return len(self._rgb)
+
+    def __getitem__(self, idx: int) -> Colors:
+        h, sl = divmod(idx, self._n_sl)
+        s, l = divmod(sl, self._n_l)  # noqa: E741
+        rgb = self._rgb[idx]
+        start = idx * 7
+        return (
+            (self._hues[h], self._saturation[s], self._lightness[l]),
+            (rgb >> 16, rgb >> 8 & 0xFF, rgb & 0xFF),
+            self._hex[start : start + 7],
+        )
+
+    def int_table(self) -> array:
+        return self._rgb
+
+
+class ColorHasher:  # noqa: PLR0904
+    """
+    Reusable color generator with params validated once.
+
+    Use it instead of ``ColorHash`` or ``color_hash()`` when the same params
+    are used for many objects. Params are validated and frozen on creation.
+
+    Args:
+        lightness, saturation, min_h, max_h: same as for ``ColorHash``.
+        table: if set, all possible colors are precomputed (on first use) into
+               a lookup table. There are only ``359 * len(saturation) *
+               len(lightness)`` of them (up to 360 hues with ``hue_version=2``),
+               so getting a color is then just a hash and a table lookup. With
+               models other than ``"hsl"``, colors of the table are converted
+               on first use of each, unless whole table is needed (eg. by
+               ``freeze()``).
+        cache_size: if set, colors of up to this many most recently used
+                    objects are remembered (keyed on the same bytes as hashed by
+                    ``crc32_hash()``). See ``cache`` attribute for its stats.
+                    With ``cache_path``, max number of colors kept in the file.
+        cache_path: if set, colors are also kept in this SQLite database file,
+                    so other processes (or later runs) with the same params
+                    find them there, see ``SQLiteCache``. Use ``prefetch()`` to
+                    read colors of many objects at once and ``close()`` when
+                    done.
+        shared_cache: if set, colors are kept in shared memory, so all
+                      processes of a host share them, see
+                      ``SharedMemoryCache``. ``True`` creates new one (of
+                      ``cache_size`` slots), a name attaches to one created
+                      with the same params. Always uses the lookup table.
+        encoder: how objects are hashed. ``"str"`` (default) hashes ``str(obj)``
+                 encoded to UTF-8, see ``crc32_hash()``. ``"bytes"`` takes
+                 bytes-like objects (bytes, bytearray, memoryview, ...) and
+                 hashes them as they are, see ``crc32_hash_bytes()``.
+                 ``"canonical"`` is like ``"str"``, but items of sets and dicts
+                 are sorted, see ``crc32_hash_canonical()``.
+        hashfunc: name of hash function from ``HASH_FUNCTIONS``, ``"crc32"`` by
+                  default. Other hash functions give other colors.
+        model: color model, see ``ColorHash``. Models other than ``"hsl"``
+               always use the lookup table (filled on demand).
+        hue_version: how hues are picked, see ``ColorHash``.
+
+    >>> hasher = ColorHasher(lightness=(0.5,), min_h=150)
+    >>> hasher.hex("Hello World")
+    '#2dd2cb'
+    """
+
+    __slots__ = (
+        "_entries",
+        "_hash",
+        "_hash_bytes",
+        "_hue_div",
+        "_hues",
+        "_int_table",
+        "_key_bytes",
+        "_n_l",
+        "_n_s",
+        "_table",
+        "_to_rgb",
+        "cache",
+        "cache_path",
+        "encoder",
+        "hashfunc",
+        "hue_version",
+        "lightness",
+        "max_h",
+        "min_h",
+        "model",
+        "saturation",
+        "table",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        lightness: Sequence[float] = (0.35, 0.5, 0.65),
+        saturation: Sequence[float] = (0.35, 0.5, 0.65),
+        min_h: int | None = None,
+        max_h: int | None = None,
+        *,
+        table: bool = False,
+        cache_size: int | None = None,
+        cache_path: str | os.PathLike | None = None,
+        shared_cache: bool | str = False,
+        encoder: str = "str",
+        hashfunc: str = "crc32",
+        model: str = "hsl",
+        hue_version: int = 1,
+    ):
+        lightness = tuple(lightness)
+        saturation = tuple(saturation)
+        min_h, max_h = _validate_params(lightness, saturation, min_h, max_h)
+        if encoder not in ENCODERS:
+            msg = f"encoder must be one of {tuple(ENCODERS)}"
+            raise ValueError(msg)
+        if hashfunc not in HASH_FUNCTIONS:
+            msg = f"hashfunc must be one of {tuple(HASH_FUNCTIONS)}"
+            raise ValueError(msg)
+        if model not in MODELS:
+            msg = f"model must be one of {tuple(MODELS)}"
+            raise ValueError(msg)
+        if hue_version not in HUE_VERSIONS:
+            msg = f"hue_version must be one of {HUE_VERSIONS}"
+            raise ValueError(msg)
+        # integer hues of version 2 need whole bounds (floats like 10.0 are fine)
+        if (
+            hue_version != 1
+            and min_h is not None
+            and not (min_h == int(min_h) and max_h == int(max_h))
         ):
-            msg: str = "min_h and max_h must be in range [0, 360] with min_h <= max_h"
+            msg = "min_h and max_h must be whole numbers with hue_version 2"
             raise ValueError(msg)
-        h = (h / 1000) * (max_h - min_h) + min_h
-    hash_val //= 360
-    s = saturation[hash_val % len(saturation)]
-    hash_val //= len(saturation)
-    l = lightness[hash_val % len(lightness)]  # noqa
 
-    return (h, s, l)
+        self.lightness: tuple[float, ...] = lightness
+        self.saturation: tuple[float, ...] = saturation
+        self.min_h: int | None = min_h
+        self.max_h: int | None = max_h
+        self._n_l: int = len(lightness)
+        self._n_s: int = len(saturation)
+        self.hue_version: int = hue_version
+        # hue is picked as "hues[hash_val % len(hues)]", then "hash_val //= div"
+        self._hues, self._hue_div = _hues(min_h, max_h, hue_version)
+        # other models are too slow to convert colors again, see "_entry()"
+        self.table: bool = table or model != "hsl" or bool(shared_cache)
+        self.model: str = model
+        self._to_rgb = MODELS[model]
+        # lazily built lookup table, see "_key()"
+        self._table: list[Colors] | _FrozenTable | None = None
+        # colors of lookup table converted so far, see "_entry()"
+        self._entries: list[Colors | None] | None = None
+        self._int_table: list[int] | array | None = None
+        self.encoder: str = encoder
+        self.hashfunc: str = hashfunc
+        self._key_bytes = ENCODERS[encoder]
+        self._hash_bytes = HASH_FUNCTIONS[hashfunc]
+        self._hash = _object_hash_function(encoder, hashfunc)
+        self.cache_path: str | None = None
+        self.cache: LRUCache | SQLiteCache | SharedMemoryCache | None = None
+        if shared_cache:
+            self.cache = SharedMemoryCache(
+                self._lookup_table(),
+                fingerprint(self._params()),
+                None if shared_cache is True else shared_cache,
+                DEFAULT_SHARED_SLOTS if cache_size is None else cache_size,
+                create=shared_cache is True,
+            )
+        elif cache_path is not None:
+            if cache_size is None:
+                cache_size = DEFAULT_PERSISTENT_MAXSIZE
+            self.cache_path = os.fspath(cache_path)
+            self.cache = SQLiteCache(
+                self.cache_path,
+                fingerprint(self._params()),
+                maxsize=cache_size,
+            )
+        elif cache_size is not None:
+            self.cache = LRUCache(cache_size)
+
+    def _params(self) -> tuple:
+        return (
+            self.lightness,
+            self.saturation,
+            self.min_h,
+            self.max_h,
+            self.encoder,
+            self.hashfunc,
+            self.model,
+            self.hue_version,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ColorHasher(lightness={self.lightness}, saturation={self.saturation}, "
+            f"min_h={self.min_h}, max_h={self.max_h}, encoder={self.encoder!r}, "
+            f"hashfunc={self.hashfunc!r}, model={self.model!r}, "
+            f"hue_version={self.hue_version})"
+        )
+
+    def __reduce__(self) -> tuple:
+        # pickle params only, not lookup table or cache (eg. for worker processes)
+        cache_size = None if self.cache is None else self.cache.maxsize
+        # other processes attach to the same shared memory
+        shared_cache = getattr(self.cache, "name", False)
+        return (
+            partial(
+                ColorHasher,
+                lightness=self.lightness,
+                saturation=self.saturation,
+                min_h=self.min_h,
+                max_h=self.max_h,
+                table=self.table,
+                cache_size=cache_size,
+                cache_path=self.cache_path,
+                shared_cache=shared_cache,
+                encoder=self.encoder,
+                hashfunc=self.hashfunc,
+                model=self.model,
+                hue_version=self.hue_version,
+            ),
+            (),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColorHasher):
+            return NotImplemented
+        return self._params() == other._params()
+
+    def __hash__(self) -> int:
+        return hash(self._params())
+
+    def _key(self, hash_val: int) -> int:
+        """
+        Return index of color in lookup table.
+        """
+        h = hash_val % len(self._hues)
+        hash_val //= self._hue_div
+        s = hash_val % self._n_s
+        hash_val //= self._n_s
+        l = hash_val % self._n_l  # noqa: E741
+
+        return (h * self._n_s + s) * self._n_l + l
+
+    def _entry(self, idx: int) -> Colors:
+        """
+        Return colors at ``idx`` of lookup table, converted on first use.
+        """
+        entries = self._entries
+        if entries is None:
+            size = len(self._hues) * self._n_s * self._n_l
+            entries = self._entries = [None] * size
+        colors = entries[idx]
+        if colors is None:
+            h, sl = divmod(idx, self._n_s * self._n_l)
+            s, l = divmod(sl, self._n_l)  # noqa: E741
+            hsl = (self._hues[h], self.saturation[s], self.lightness[l])
+            rgb = self._to_rgb(hsl)
+            colors = entries[idx] = (hsl, rgb, rgb2hex(rgb))
+        return colors
+
+    def _whole_table(self) -> bool:
+        """
+        Return whether whole lookup table is used, not just its used colors.
+
+        Converting all colors of models other than ``"hsl"`` takes long, so
+        they are converted one by one (see ``_entry()``), unless whole table
+        is needed (eg. by ``freeze()``).
+        """
+        return self._table is not None or self.model == "hsl"
+
+    def _lookup_table(self) -> list[Colors] | _FrozenTable:
+        table = self._table
+        if table is None:
+            table = []
+            for h in self._hues:
+                for s in self.saturation:
+                    for l in self.lightness:  # noqa: E741
+                        rgb = self._to_rgb((h, s, l))
+                        table.append(((h, s, l), rgb, rgb2hex(rgb)))
+            # assign when complete, concurrent builds just do the same work
+            self._table = table
+            self._entries = None
+        return table
+
+    def _lookup_int_table(self) -> list[int] | array:
+        int_table = self._int_table
+        if int_table is None:
+            int_table = [rgb2int(rgb) for _, rgb, _ in self._lookup_table()]
+            self._int_table = int_table
+        return int_table
+
+    def freeze(self) -> ColorHasher:
+        """
+        Build lookup table packed into compact arrays, return the hasher.
+
+        Call it before forking worker processes, they share the table then
+        (list of tuples would get copied into every worker on first use).
+        Colors are the same, just unpacked on every access.
+        """
+        table = self._lookup_table()
+        if not isinstance(table, _FrozenTable):
+            frozen = _FrozenTable(self._hues, self.saturation, self.lightness, table)
+            self._int_table = frozen.int_table()
+            self._table = frozen
+        self.table = True
+        return self
+
+    def _hsl(self, hash_val: int) -> tuple[float, float, float]:
+        hues = self._hues
+        h = hues[hash_val % len(hues)]
+        hash_val //= self._hue_div
+        s = self.saturation[hash_val % self._n_s]
+        hash_val //= self._n_s
+        l = self.lightness[hash_val % self._n_l]  # noqa: E741
+
+        return (h, s, l)
+
+    def _colors(self, hash_val: int) -> Colors:
+        if self.table:
+            if self._whole_table():
+                return self._lookup_table()[self._key(hash_val)]
+            return self._entry(self._key(hash_val))
+        hsl = self._hsl(hash_val)
+        rgb = self._to_rgb(hsl)
+        return hsl, rgb, rgb2hex(rgb)
+
+    def hsl(self, obj: Any) -> tuple[float, float, float]:
+        """
+        Return ``(H, S, L)`` color of ``obj``, same as ``color_hash()``.
+        """
+        if self.table or self.cache is not None:
+            return self.hsl_rgb_hex(obj)[0]
+        return self._hsl(self._hash(obj))
+
+    def rgb(self, obj: Any) -> tuple[int, int, int]:
+        """
+        Return ``(R, G, B)`` color of ``obj``.
+        """
+        if self.table or self.cache is not None:
+            return self.hsl_rgb_hex(obj)[1]
+        return self._to_rgb(self._hsl(self._hash(obj)))
+
+    def hex(self, obj: Any) -> str:
+        """
+        Return hex-formatted RGB color of ``obj``.
+        """
+        if self.table or self.cache is not None:
+            return self.hsl_rgb_hex(obj)[2]
+        return rgb2hex(self._to_rgb(self._hsl(self._hash(obj))))
+
+    def rgb_int(self, obj: Any) -> int:
+        """
+        Return RGB color of ``obj`` packed into ``0xRRGGBB`` integer.
+        """
+        if self.table and self.cache is None and self._whole_table():
+            return self._lookup_int_table()[self._key(self._hash(obj))]
+        return rgb2int(self.rgb(obj))
+
+    def hsl_rgb_hex(self, obj: Any) -> Colors:
+        """
+        Return ``(hsl, rgb, hex)`` colors of ``obj`` at once.
+        """
+        cache = self.cache
+        if cache is None:
+            return self._colors(self._hash(obj))
+
+        # same bytes as hashed by "self._hash()"
+        key = self._key_bytes(obj)
+        colors = cache.get(key)
+        if colors is None:
+            colors = self._colors(self._hash_bytes(key))
+            cache.set(key, colors)
+        return colors
+
+    def hsl_rgb_hex_stream(
+        self,
+        chunks: Iterable[bytes | bytearray | memoryview],
+    ) -> Colors:
+        """
+        Return ``(hsl, rgb, hex)`` colors of bytes-like ``chunks``.
+
+        Colors are the same as of the chunks joined (with ``encoder="bytes"``),
+        but they are hashed one by one. The cache is not used.
+        """
+        hash_stream = HASH_STREAM_FUNCTIONS.get(self.hashfunc)
+        if hash_stream is None:
+            msg = f"hash function {self.hashfunc!r} can't hash streams"
+            raise ValueError(msg)
+        return self._colors(hash_stream(chunks))
+
+    def prefetch(self, objs: Iterable[Any]) -> int:
+        """
+        Read cached colors of many objects at once (with ``cache_path`` only).
+
+        Returns number of objects found in the cache.
+        """
+        prefetch = getattr(self.cache, "prefetch", None)
+        if prefetch is None:
+            return 0
+        key_bytes = self._key_bytes
+        return prefetch(key_bytes(obj) for obj in objs)
+
+    def flush(self) -> None:
+        """
+        Write new colors of the cache to its file (with ``cache_path`` only).
+        """
+        flush = getattr(self.cache, "flush", None)
+        if flush is not None:
+            flush()
+
+    def close(self) -> None:
+        """
+        Close the cache: write new colors to its file (with ``cache_path``) or
+        detach from shared memory (with ``shared_cache``).
+
+        Safe to call repeatedly. The hasher can be used as a context manager
+        closing it on exit.
+        """
+        close = getattr(self.cache, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> ColorHasher:  # noqa: PYI034
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def factorize(self, objs: Iterable[Any]) -> tuple[list[int], list[Any]]:
+        """
+        Return index of every object into list of distinct ones, and that list.
+
+        Objects are distinct by the bytes they are hashed from (strings, bytes
+        and integers simply by value), so objects found equal always have the
+        same color, even unhashable ones like lists. Unlike ``==``, eg. ``1``,
+        ``1.0`` and ``True`` are distinct.
+
+        >>> ColorHasher().factorize(["a", 1, "a", 1.0])
+        ([0, 1, 0, 2], ['a', 1, 1.0])
+        """
+        key_bytes = self._key_bytes
+        plain_types = _PLAIN_KEY_TYPES
+
+        index: dict[Any, int] = {}
+        keys: list[Any] = []
+        codes: list[int] = []
+        for obj in objs:
+            # 1-tuple keeps encoded keys apart from plain "bytes" ones
+            key = obj if obj.__class__ in plain_types else (key_bytes(obj),)
+            code = index.get(key)
+            if code is None:
+                code = index[key] = len(keys)
+                keys.append(obj)
+            codes.append(code)
+        return codes, keys
+
+    def dedup_many(self, objs: Iterable[Any], color: str = "hsl") -> DedupResult:
+        """
+        Return colors of ``objs``, computing each only once per distinct object.
+
+        Objects are distinct as ``factorize()`` finds them.
+
+        Args:
+            objs: objects to color.
+            color: one of "hsl", "rgb", "hex" or "rgb_int".
+
+        >>> result = ColorHasher().dedup_many(["a", "b", "a", "a"], color="hex")
+        >>> result.colors
+        ['#77862d', '#5366ac', '#77862d', '#77862d']
+        >>> result.keys, result.codes, result.dedup_ratio
+        (['a', 'b'], [0, 1, 0, 0], 2.0)
+        """
+        if color not in COLORS:
+            msg = f"color must be one of {COLORS}"
+            raise ValueError(msg)
+        codes, keys = self.factorize(objs)
+        key_colors = list(map(getattr(self, color), keys))
+        colors = [key_colors[code] for code in codes]
+        return DedupResult(colors, keys, key_colors, codes)
+
+    def _hash_many(self, objs: Iterable[Any]) -> np.ndarray:
+        np = _import_numpy()
+        if isinstance(objs, np.ndarray):
+            # python scalars hash same as numpy ones, but are faster to iterate
+            objs = objs.ravel().tolist()
+        return np.fromiter(map(self._hash, objs), dtype=np.int64)
+
+    def hsl_many(
+        self,
+        objs: Iterable[Any],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Batch version of ``hsl()``, see ``color_hash_many()``.
+        """
+        np = _import_numpy()
+        hash_vals = self._hash_many(objs)
+
+        h = np.asarray(self._hues)[hash_vals % len(self._hues)]
+        hash_vals //= self._hue_div
+        s = np.asarray(self.saturation, dtype=np.float64)[hash_vals % self._n_s]
+        hash_vals //= self._n_s
+        l = np.asarray(self.lightness, dtype=np.float64)[hash_vals % self._n_l]  # noqa: E741
+
+        return h, s, l
+
+    def rgb_int_many(self, objs: Iterable[Any]) -> np.ndarray:
+        """
+        Batch version of ``rgb_int()``, see ``color_hash_int_many()``.
+        """
+        np = _import_numpy()
+        if self.table:
+            hash_vals = self._hash_many(objs)
+            h = hash_vals % len(self._hues)
+            hash_vals //= self._hue_div
+            s = hash_vals % self._n_s
+            hash_vals //= self._n_s
+            l = hash_vals % self._n_l  # noqa: E741
+            idx = (h * self._n_s + s) * self._n_l + l
+            if not self._whole_table():
+                # convert only colors used
+                keys, inverse = np.unique(idx, return_inverse=True)
+                ints = [rgb2int(self._entry(key)[1]) for key in keys.tolist()]
+                return np.array(ints, dtype=np.uint32)[inverse]
+            int_table = np.asarray(self._lookup_int_table(), dtype=np.uint32)
+            return int_table[idx]
+
+        r, g, b = hsl2rgb_many(*self.hsl_many(objs))
+        return (
+            r.astype(np.uint32) << 16 | g.astype(np.uint32) << 8 | b.astype(np.uint32)
+        )
+
+
+@lru_cache(maxsize=128, typed=True)
+def _shared_hasher(*params: Any) -> ColorHasher:
+    # flat params, so that "typed" tells apart eg. "1" and "1.0" of lightness
+    table, encoder, hashfunc, model, hue_version, min_h, max_h, n_l, *sl = params
+    return ColorHasher(
+        sl[:n_l],
+        sl[n_l:],
+        min_h,
+        max_h,
+        table=table,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        model=model,
+        hue_version=hue_version,
+    )
+
+
+def get_hasher(  # noqa: PLR0913
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    model: str = "hsl",
+    hue_version: int = 1,
+    table: bool = False,
+    hasher: ColorHasher | None = None,
+) -> ColorHasher:
+    """
+    Return ``ColorHasher`` of ``ColorHash`` params, shared by all callers.
+
+    Module functions (and ``colorhash.pandas``, ...) get their hashers here, so
+    same params are validated (and lookup tables built) only once. Up to 128
+    of them are kept. If ``hasher`` is set, it is returned as it is.
+
+    >>> get_hasher(lightness=[0.5]) is get_hasher((0.5,))
+    True
+    """
+    if hasher is not None:
+        return hasher
+    return _shared_hasher(
+        table,
+        encoder,
+        hashfunc,
+        model,
+        hue_version,
+        min_h,
+        max_h,
+        len(lightness),
+        *lightness,
+        *saturation,
+    )
+
+
+def preload(configs: Iterable[Mapping[str, Any]] = ({},)) -> list[ColorHasher]:
+    """
+    Prepare everything needed for colors of given params, before forking.
+
+    For every config (params of ``ColorHash``, as a mapping), params are
+    validated and lookup tables are built and packed into compact arrays
+    (``ColorHasher.freeze()``). Module functions using lookup tables
+    (``color_hash_int()``, ``color_hash_dedup()``, ``ColorHash`` with models
+    other than ``"hsl"``, ``colorhash.pandas``, ...) with these params then
+    use them, so forked workers share them instead of building (or copying)
+    their own. ``color_hash()`` and ``ColorHash`` with ``"hsl"`` model compute
+    colors without a table, they just skip validation of params. Only up to
+    128 configs are kept, see ``get_hasher()``.
+
+    Returns:
+        Frozen ``ColorHasher`` of every config (the one using lookup table), in
+        order.
+
+    >>> [hasher] = preload([{"lightness": [0.5], "min_h": 150}])
+    >>> hasher.hex("Hello World")
+    '#2dd2cb'
+    """
+    hashers = []
+    for config in configs:
+        # same hashers as module functions get
+        plain = get_hasher(**config)
+        if plain.table:
+            plain.freeze()
+        hashers.append(get_hasher(**config, table=True).freeze())
+    return hashers
+
+
+def color_hash(  # noqa: PLR0913
+    obj: Any,
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    hue_version: int = 1,
+    hasher: ColorHasher | None = None,
+) -> tuple[float, float, float]:
+    """
+    Calculate the color for the given object.
+
+    This function takes the same arguments as the ``ColorHash`` class.
+
+    Returns:
+        A ``(H, S, L)`` tuple.
+    """
+    hasher = get_hasher(
+        lightness,
+        saturation,
+        min_h,
+        max_h,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        hue_version=hue_version,
+        hasher=hasher,
+    )
+    return hasher.hsl(obj)
+
+
+def color_hash_int(  # noqa: PLR0913
+    obj: Any,
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    model: str = "hsl",
+    hue_version: int = 1,
+) -> int:
+    """
+    Calculate the color for the given object as ``0xRRGGBB`` integer.
+
+    This function takes the same arguments as the ``ColorHash`` class. Use
+    ``int2hex()`` to get hex string.
+
+    >>> hex(color_hash_int("Hello World"))
+    '0x2dd24b'
+    """
+    hasher = get_hasher(
+        lightness,
+        saturation,
+        min_h,
+        max_h,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        model=model,
+        hue_version=hue_version,
+        table=True,
+    )
+    return hasher.rgb_int(obj)
+
+
+def color_hash_dedup(  # noqa: PLR0913
+    objs: Iterable[Any],
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    color: str = "hsl",
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    model: str = "hsl",
+    hue_version: int = 1,
+) -> DedupResult:
+    """
+    Batch version of ``color_hash()``, coloring each distinct object only once.
+
+    Useful when the same keys repeat a lot (eg. in event streams), see
+    ``ColorHasher.dedup_many()``.
+
+    Args:
+        objs: objects to color.
+        lightness, saturation, min_h, max_h, encoder, hashfunc, model,
+            hue_version: same as for ``ColorHash``.
+        color: one of "hsl" (as ``color_hash()`` gives), "rgb", "hex" or
+               "rgb_int".
+
+    Returns:
+        ``DedupResult`` with colors of all objects, distinct objects with their
+        colors and the dedup ratio.
+
+    >>> result = color_hash_dedup(["Hello World", "hey", "Hello World"])
+    >>> result.colors
+    [(131, 0.65, 0.5), (291, 0.5, 0.35), (131, 0.65, 0.5)]
+    >>> result.dedup_ratio
+    1.5
+    """
+    hasher = get_hasher(
+        lightness,
+        saturation,
+        min_h,
+        max_h,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        model=model,
+        hue_version=hue_version,
+        table=True,
+    )
+    return hasher.dedup_many(objs, color)
+
+
+def _import_numpy():
+    """
+    Import optional ``numpy`` dependency used by batch functions.
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as exc:
+        msg = "batch functions require numpy, install it with 'colorhash[numpy]'"
+        raise ImportError(msg) from exc
+    return np
+
+
+def color_hash_many(  # noqa: PLR0913
+    objs: Iterable[Any],
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    hue_version: int = 1,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate colors for many objects at once.
+
+    This is a batch version of ``color_hash()``. Params are validated once and
+    hue, saturation and lightness are picked using array operations. Results
+    are the same as calling ``color_hash()`` for each object. Requires ``numpy``.
+
+    Args:
+        objs: iterable of objects, or 1-D numpy array (eg. of strings or bytes).
+        lightness, saturation, min_h, max_h, encoder, hashfunc, hue_version:
+            same as for ``ColorHash``.
+
+    Returns:
+        A ``(H, S, L)`` tuple of parallel numpy arrays. ``H`` is an integer
+        array, unless ``min_h`` or ``max_h`` is set (then it is float).
+
+    >>> h, s, l = color_hash_many(["Hello World", "hey"])
+    >>> h.tolist(), s.tolist(), l.tolist()
+    ([131, 291], [0.65, 0.5], [0.5, 0.35])
+    """
+    hasher = get_hasher(
+        lightness,
+        saturation,
+        min_h,
+        max_h,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        hue_version=hue_version,
+    )
+    return hasher.hsl_many(objs)
+
+
+def color_hash_int_many(  # noqa: PLR0913
+    objs: Iterable[Any],
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    model: str = "hsl",
+    hue_version: int = 1,
+) -> np.ndarray:
+    """
+    Batch version of ``color_hash_int()``. Requires ``numpy``.
+
+    Returns:
+        A ``uint32`` numpy array of ``0xRRGGBB`` colors.
+
+    >>> [hex(x) for x in color_hash_int_many(["Hello World", "hey"]).tolist()]
+    ['0x2dd24b', '0x782d86']
+    """
+    hasher = get_hasher(
+        lightness,
+        saturation,
+        min_h,
+        max_h,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        model=model,
+        hue_version=hue_version,
+        table=True,
+    )
+    return hasher.rgb_int_many(objs)
+
+
+def _hue_to_rgb_many(p: np.ndarray, q: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Batch version of ``hue_to_rgb()``.
+    """
+    np = _import_numpy()
+    t = np.where(t < 0, t + 1, np.where(t > 1, t - 1, t))
+    return np.select(
+        [t < 1 / 6, t < 1 / 2, t < 2 / 3],
+        [p + (q - p) * 6 * t, q, p + (q - p) * (2 / 3 - t) * 6],
+        default=p,
+    )
+
+
+def hsl2rgb_many(
+    h: np.ndarray,
+    s: np.ndarray,
+    l: np.ndarray,  # noqa: E741
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batch version of ``hsl2rgb()``, takes arrays returned by ``color_hash_many()``.
+
+    Returns:
+        A ``(R, G, B)`` tuple of parallel ``uint8`` numpy arrays. Values are the
+        same as ``hsl2rgb()`` would return for each color.
+    """
+    np = _import_numpy()
+    h = np.asarray(h, dtype=np.float64) / MAX_HUE
+    s = np.asarray(s, dtype=np.float64)
+    l = np.asarray(l, dtype=np.float64)  # noqa: E741
+    q = np.where(l < 0.5, l * (1 + s), l + s - l * s)  # noqa: PLR2004
+    p = 2 * l - q
+
+    r = np.round(_hue_to_rgb_many(p, q, h + 1 / 3) * 255).astype(np.uint8)
+    g = np.round(_hue_to_rgb_many(p, q, h) * 255).astype(np.uint8)
+    b = np.round(_hue_to_rgb_many(p, q, h - 1 / 3) * 255).astype(np.uint8)
+
+    return r, g, b
 
 
 class ColorHash:
@@ -175,33 +1835,149 @@ class ColorHash:
                     number.
         min_h: if set, limit the hue component to this lower value.
         max_h: if set, limit the hue component to this upper value.
+        encoder: how ``obj`` is hashed. ``"str"`` (default) hashes ``str(obj)``,
+                 ``"bytes"`` hashes bytes-like ``obj`` as it is (so UTF-8
+                 encoded string gets the same color as the string itself).
+                 ``"canonical"`` sorts items of sets, frozensets and dicts, so
+                 they get the same color in every process.
+        hashfunc: name of hash function from ``HASH_FUNCTIONS``. Default
+                  ``"crc32"`` keeps colors same as always.
+        model: color model converting picked hue, saturation and lightness to
+               RGB. ``"hsl"`` (default) keeps colors same as always.
+               ``"oklch"`` is perceptually uniform (colors of same lightness
+               look equally light): ``lightness`` is OKLCH lightness and
+               ``saturation`` is OKLCH chroma as a fraction of
+               ``OKLCH_MAX_CHROMA``, same as percents in CSS ``oklch()``.
+               Colors out of sRGB gamut get lower chroma.
+        hue_version: how hash value is mapped to hue. ``1`` (default) keeps
+                     colors same as always: one of 359 hues, with
+                     ``min_h``/``max_h`` squeezed into first ~third of the
+                     range. ``2`` picks integer hue evenly from the whole range
+                     (``min_h`` to ``max_h`` inclusive, 0-359 by default).
+        hasher: a prepared ``ColorHasher``. If set, it is used instead of the
+                params above.
 
     Attributes:
-        hsl: HSL representation of the color value.
-        rgb: RGB representation of the color value.
-        hex: hex-formatted RGB color value.
+        hsl: HSL representation of the color value (with ``model="oklch"``,
+             OKLCH hue, relative chroma and lightness).
+        rgb: RGB representation of the color value (computed once, on access).
+        rgb_int: RGB color value packed into ``0xRRGGBB`` integer.
+        hex: hex-formatted RGB color value (computed once, on access).
     """
 
-    def __init__(
+    __slots__ = ("_hex", "_rgb", "hsl")
+
+    def __init__(  # noqa: PLR0913
         self,
         obj: Any,
         lightness: Sequence[float] = (0.35, 0.5, 0.65),
         saturation: Sequence[float] = (0.35, 0.5, 0.65),
         min_h: int | None = None,
         max_h: int | None = None,
+        *,
+        encoder: str = "str",
+        hashfunc: str = "crc32",
+        model: str = "hsl",
+        hue_version: int = 1,
+        hasher: ColorHasher | None = None,
     ):
-        self.hsl: tuple[float, float, float] = color_hash(
-            obj=obj,
-            lightness=lightness,
-            saturation=saturation,
-            min_h=min_h,
-            max_h=max_h,
+        hasher = get_hasher(
+            lightness,
+            saturation,
+            min_h,
+            max_h,
+            encoder=encoder,
+            hashfunc=hashfunc,
+            model=model,
+            hue_version=hue_version,
+            hasher=hasher,
         )
+        self._rgb: tuple[int, int, int] | None = None
+        self._hex: str | None = None
+        if hasher.table:
+            # table lookup is cheaper than computing hsl alone
+            hsl, self._rgb, self._hex = hasher.hsl_rgb_hex(obj)
+        else:
+            hsl = hasher.hsl(obj)
+        self.hsl: tuple[float, float, float] = hsl
+
+    @classmethod
+    def from_stream(  # noqa: PLR0913
+        cls,
+        chunks: Iterable[bytes | bytearray | memoryview],
+        lightness: Sequence[float] = (0.35, 0.5, 0.65),
+        saturation: Sequence[float] = (0.35, 0.5, 0.65),
+        min_h: int | None = None,
+        max_h: int | None = None,
+        *,
+        hashfunc: str = "crc32",
+        model: str = "hsl",
+        hue_version: int = 1,
+        hasher: ColorHasher | None = None,
+    ) -> ColorHash:
+        """
+        Return color of bytes-like ``chunks``, hashed one by one.
+
+        The color is the same as ``ColorHash(b"".join(chunks),
+        encoder="bytes")``, without joining them. Takes the same params as
+        ``ColorHash`` (except ``encoder``).
+
+        >>> ColorHash.from_stream([b"Hello ", b"World"]).hex
+        '#2dd24b'
+        """
+        hasher = get_hasher(
+            lightness,
+            saturation,
+            min_h,
+            max_h,
+            encoder="bytes",
+            hashfunc=hashfunc,
+            model=model,
+            hue_version=hue_version,
+            hasher=hasher,
+        )
+        self = cls.__new__(cls)
+        self.hsl, self._rgb, self._hex = hasher.hsl_rgb_hex_stream(chunks)
+        return self
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | os.PathLike,
+        *args: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> ColorHash:
+        """
+        Return color of contents of file at ``path``.
+
+        The file is read in blocks of ``chunk_size`` bytes, so memory use does
+        not depend on its size. Takes the same params as ``from_stream()``.
+        """
+        hasher = kwargs.get("hasher")
+        hashfunc = (
+            kwargs.get("hashfunc", "crc32") if hasher is None else hasher.hashfunc
+        )
+        # registered stream functions may keep chunks, they get new ones
+        reuse_buffer = HASH_STREAM_FUNCTIONS.get(hashfunc) in _BUFFER_STREAM_FUNCTIONS
+        chunks = _file_chunks(path, chunk_size, reuse_buffer=reuse_buffer)
+        return cls.from_stream(chunks, *args, **kwargs)
 
     @property
     def rgb(self) -> tuple[int, int, int]:
-        return hsl2rgb(self.hsl)
+        if self._rgb is None:
+            self._rgb = hsl2rgb(self.hsl)
+        return self._rgb
+
+    @property
+    def rgb_int(self) -> int:
+        """
+        RGB color value packed into ``0xRRGGBB`` integer.
+        """
+        return rgb2int(self.rgb)
 
     @property
     def hex(self) -> str:
-        return rgb2hex(self.rgb)
+        if self._hex is None:
+            self._hex = rgb2hex(self.rgb)
+        return self._hex
@@ -0,0 +1,178 @@
+"""
+Assign distinguishable colors to a known set of keys (eg. chart legend).
+
+>>> from colorhash.palette import assign_palette
+>>> assign_palette(["Hello World", "hey"])
+['#2dd24b', '#782d86']
+"""
+
+from __future__ import annotations
+
+from math import gcd
+from typing import Any
+from typing import Iterable
+from typing import Sequence
+
+from .colorhash import COLORS
+from .colorhash import ColorHasher
+from .colorhash import Colors
+from .colorhash import get_hasher
+from .colorhash import rgb2int
+from .colorhash import rgb2oklab
+
+# in OKLab distance * 100, ~2 is just noticeable difference
+DEFAULT_MIN_DELTA_E = 5.0
+DEFAULT_MAX_TRIES = 64
+
+
+class _Grid:
+    """
+    Points in OKLab space, bucketed into cubes of ``radius`` side.
+
+    All points closer than ``radius`` to a point are in the 27 cubes around it.
+    Only points at least ``radius`` apart are added, so every cube holds just a
+    few of them and a search takes constant time.
+    """
+
+    __slots__ = ("_cells", "_radius")
+
+    def __init__(self, radius: float):
+        self._radius = radius
+        self._cells: dict[tuple[int, int, int], list[tuple[float, ...]]] = {}
+
+    def _cell(self, point: tuple[float, ...]) -> tuple[int, int, int]:
+        r = self._radius
+        return int(point[0] // r), int(point[1] // r), int(point[2] // r)
+
+    def add(self, point: tuple[float, ...]) -> None:
+        self._cells.setdefault(self._cell(point), []).append(point)
+
+    def has_near(self, point: tuple[float, ...]) -> bool:
+        """
+        Return whether any point is closer than ``radius``.
+        """
+        x, y, z = point
+        cx, cy, cz = self._cell(point)
+        cells = self._cells
+        max_dist = self._radius**2
+        for i in (cx - 1, cx, cx + 1):
+            for j in (cy - 1, cy, cy + 1):
+                for k in (cz - 1, cz, cz + 1):
+                    for px, py, pz in cells.get((i, j, k), ()):
+                        if (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2 < max_dist:
+                            return True
+        return False
+
+
+class _Palette:
+    """
+    Colors of a lookup table, assigned so that they are not too similar.
+    """
+
+    __slots__ = ("_blocked", "_grid", "_labs", "_stride", "_table")
+
+    def __init__(self, table: list[Colors], min_delta_e: float):
+        self._table = table
+        self._grid = _Grid(min_delta_e / 100)
+        self._labs: dict[int, tuple[float, float, float]] = {}
+        # indexes of colors too similar to assigned ones (it never changes back)
+        self._blocked: set[int] = set()
+        # step coprime to table size (so all colors get visited), ~golden ratio
+        size = len(table)
+        stride = max(1, round(size * 0.381966))
+        while gcd(stride, size) != 1:
+            stride += 1
+        self._stride = stride
+
+    def assign(self, idx: int, max_tries: int) -> int:
+        """
+        Return index of the first free color trying from ``idx``, mark it used.
+
+        If all tried colors are too similar to used ones, ``idx`` is returned.
+        """
+        table, blocked, grid = self._table, self._blocked, self._grid
+        size = len(table)
+        start = idx
+        for _ in range(min(max_tries, size - len(blocked))):
+            while idx in blocked:
+                idx = (idx + self._stride) % size
+            lab = self._labs.get(idx)
+            if lab is None:
+                lab = self._labs[idx] = rgb2oklab(table[idx][1])
+            blocked.add(idx)
+            if not grid.has_near(lab):
+                grid.add(lab)
+                return idx
+        return start
+
+
+def assign_palette(  # noqa: PLR0913
+    keys: Iterable[Any],
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    color: str = "hex",
+    min_delta_e: float = DEFAULT_MIN_DELTA_E,
+    max_tries: int = DEFAULT_MAX_TRIES,
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    model: str = "hsl",
+    hue_version: int = 1,
+    hasher: ColorHasher | None = None,
+) -> list[Any]:
+    """
+    Return colors of ``keys``, distinguishable from each other where possible.
+
+    Every key starts with its usual color (as ``ColorHash`` gives). When it is
+    too similar to a color already assigned, other colors of the same palette
+    are tried, in a fixed order. Keys are processed in order of the bytes they
+    are hashed from, so colors depend only on the set of keys, not on their
+    order. Similar colors are found using a grid over OKLab space, so it runs
+    in about linear time.
+
+    Args:
+        keys: keys to color. Equal keys get the same color.
+        lightness, saturation, min_h, max_h, encoder, hashfunc, model,
+            hue_version, hasher: same as for ``ColorHash``.
+        color: one of "hsl", "rgb", "hex" or "rgb_int".
+        min_delta_e: min perceptual difference of any two colors, as OKLab
+                     distance * 100 (about CIELAB ΔE).
+        max_tries: max number of colors tried per key. If none of them is
+                   different enough, the key keeps its usual color.
+
+    Returns:
+        List of colors, in order of ``keys``.
+    """
+    if color not in COLORS:
+        msg = f"color must be one of {COLORS}"
+        raise ValueError(msg)
+    if min_delta_e <= 0 or max_tries < 1:
+        msg = "min_delta_e must be > 0 and max_tries >= 1"
+        raise ValueError(msg)
+    hasher = get_hasher(
+        lightness,
+        saturation,
+        min_h,
+        max_h,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        model=model,
+        hue_version=hue_version,
+        table=True,
+        hasher=hasher,
+    )
+
+    table = hasher._lookup_table()  # noqa: SLF001
+    palette = _Palette(table, min_delta_e)
+    key_bytes = [hasher._key_bytes(key) for key in keys]  # noqa: SLF001
+    assigned = {
+        data: palette.assign(hasher._key(hasher._hash_bytes(data)), max_tries)  # noqa: SLF001
+        for data in sorted(set(key_bytes))
+    }
+
+    if color == "rgb_int":
+        return [rgb2int(table[assigned[data]][1]) for data in key_bytes]
+    pos = COLORS.index(color)
+    return [table[assigned[data]][pos] for data in key_bytes]
@@ -0,0 +1,166 @@
+"""
+Color whole ``pandas`` columns, registers ``Series.colorhash`` accessor.
+
+Every distinct value is hashed only once, colors are computed in batch (using
+``numpy``) and spread back to all rows. Missing values stay missing.
+
+>>> import pandas as pd
+>>> import colorhash.pandas
+>>> pd.Series(["Hello World", "hey", "Hello World"]).colorhash.hex().tolist()
+['#2dd24b', '#782d86', '#2dd24b']
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .colorhash import ColorHasher
+from .colorhash import get_hasher
+from .colorhash import rgb2hex_many
+
+# "infer_dtype()" of object columns, whose equal values have equal "str()"
+_EQUAL_STR_TYPES = frozenset({"empty", "string", "bytes", "integer", "boolean"})
+
+
+def _equal_values_equal_str(series: pd.Series) -> bool:
+    """
+    Return whether equal values of ``series`` always have equal ``str()``.
+
+    They don't for eg. ``0.0 == -0.0`` or ``1 == 1.0 == True``.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        # every value is one of distinct categories
+        return True
+    if dtype.kind == "f":
+        return not (series == 0).any()
+    if dtype.kind == "O":
+        return pd.api.types.infer_dtype(series, skipna=True) in _EQUAL_STR_TYPES
+    return dtype.kind != "c"
+
+
+@pd.api.extensions.register_series_accessor("colorhash")
+class ColorHashAccessor:
+    """
+    Colors of ``Series`` values, same as ``ColorHash`` gives for each of them.
+
+    Values equal in pandas, but hashed differently (eg. ``1``, ``1.0`` and
+    ``True``), get their own colors.
+
+    All methods take the same params as ``ColorHash`` (``lightness``,
+    ``saturation``, ``min_h``, ``max_h``, ``encoder``, ``hashfunc``, ``model``,
+    ``hue_version`` or a prepared ``hasher``) and return a ``Series`` with the
+    same index.
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    def _factorize(self, hasher: ColorHasher) -> tuple[np.ndarray, list[Any]]:
+        """
+        Return codes of all rows (``-1`` for missing) and distinct values.
+
+        Values are distinct as ``ColorHasher.factorize()`` finds them. Pandas
+        does it itself if equal values always have equal ``str()``.
+        """
+        series = self._series
+        if _equal_values_equal_str(series):
+            codes, uniques = pd.factorize(series)
+            return codes, uniques.tolist()
+        present = ~series.isna().to_numpy()
+        codes = np.full(len(series), -1, dtype=np.intp)
+        codes[present], uniques = hasher.factorize(series[present].tolist())
+        return codes, uniques
+
+    def _series_from(self, codes: np.ndarray, colors: Any) -> pd.Series:
+        """
+        Spread ``colors`` of distinct values back to all rows.
+
+        ``colors`` is a list of objects or a ``uint32`` numpy array.
+        """
+        if isinstance(colors, np.ndarray):
+            if (codes < 0).any():
+                nullable = pd.array(colors, dtype="UInt32")
+                data = nullable.take(codes, allow_fill=True)
+            else:
+                data = colors[codes]
+        else:
+            # extra item for code "-1" of missing values
+            values = np.empty(len(colors) + 1, dtype=object)
+            values[:-1] = colors
+            values[-1] = None
+            data = values[codes]
+        return pd.Series(data, index=self._series.index, name=self._series.name)
+
+    def rgb_int(
+        self,
+        lightness: Sequence[float] = (0.35, 0.5, 0.65),
+        saturation: Sequence[float] = (0.35, 0.5, 0.65),
+        min_h: int | None = None,
+        max_h: int | None = None,
+        **kwargs: Any,
+    ) -> pd.Series:
+        """
+        Return colors packed into ``0xRRGGBB`` integers.
+
+        Result dtype is ``uint32``, or nullable ``UInt32`` if there are missing
+        values.
+        """
+        hasher = get_hasher(lightness, saturation, min_h, max_h, table=True, **kwargs)
+        codes, uniques = self._factorize(hasher)
+        return self._series_from(codes, hasher.rgb_int_many(uniques))
+
+    def hex(
+        self,
+        lightness: Sequence[float] = (0.35, 0.5, 0.65),
+        saturation: Sequence[float] = (0.35, 0.5, 0.65),
+        min_h: int | None = None,
+        max_h: int | None = None,
+        **kwargs: Any,
+    ) -> pd.Series:
+        """
+        Return hex-formatted RGB colors.
+        """
+        hasher = get_hasher(lightness, saturation, min_h, max_h, table=True, **kwargs)
+        codes, uniques = self._factorize(hasher)
+        buf = rgb2hex_many(hasher.rgb_int_many(uniques))
+        colors = buf.decode("ascii").split("\n")[:-1]
+        return self._series_from(codes, colors)
+
+    def rgb(
+        self,
+        lightness: Sequence[float] = (0.35, 0.5, 0.65),
+        saturation: Sequence[float] = (0.35, 0.5, 0.65),
+        min_h: int | None = None,
+        max_h: int | None = None,
+        **kwargs: Any,
+    ) -> pd.Series:
+        """
+        Return ``(R, G, B)`` colors.
+        """
+        hasher = get_hasher(lightness, saturation, min_h, max_h, table=True, **kwargs)
+        codes, uniques = self._factorize(hasher)
+        ints = hasher.rgb_int_many(uniques).tolist()
+        colors = [(x >> 16, x >> 8 & 0xFF, x & 0xFF) for x in ints]
+        return self._series_from(codes, colors)
+
+    def hsl(
+        self,
+        lightness: Sequence[float] = (0.35, 0.5, 0.65),
+        saturation: Sequence[float] = (0.35, 0.5, 0.65),
+        min_h: int | None = None,
+        max_h: int | None = None,
+        **kwargs: Any,
+    ) -> pd.Series:
+        """
+        Return ``(H, S, L)`` colors.
+        """
+        hasher = get_hasher(lightness, saturation, min_h, max_h, table=True, **kwargs)
+        codes, uniques = self._factorize(hasher)
+        h, s, l = hasher.hsl_many(uniques)  # noqa: E741
+        colors = list(zip(h.tolist(), s.tolist(), l.tolist()))
+        return self._series_from(codes, colors)
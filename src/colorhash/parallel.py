@@ -0,0 +1,155 @@
+"""
+Color huge amounts of objects using multiple processes.
+
+>>> from colorhash.parallel import color_hash_map
+>>> list(color_hash_map(["Hello World", "hey"], color="hex", workers=2))
+['#2dd24b', '#782d86']
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures import wait
+from itertools import islice
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Sequence
+
+from .colorhash import COLORS
+from .colorhash import ColorHasher
+
+# big enough chunks make IPC overhead negligible compared to hashing
+DEFAULT_CHUNKSIZE = 10_000
+
+# set in every worker process by "_init_worker()"
+_worker_hasher = None
+_worker_color = None
+
+
+def _init_worker(hasher: ColorHasher, color: str) -> None:
+    global _worker_hasher, _worker_color  # noqa: PLW0603
+    _worker_hasher = hasher
+    _worker_color = color
+
+
+def _color_in_worker(hasher: ColorHasher, color: str, chunk: list[Any]) -> list[Any]:
+    """
+    Return colors of ``chunk``, new ones already written to ``hasher.cache``.
+    """
+    colors = list(map(getattr(hasher, color), chunk))
+    # workers skip exit handlers, new colors of "cache_path" are written now
+    hasher.flush()
+    return colors
+
+
+def _color_chunk(chunk: list[Any]) -> list[Any]:
+    return _color_in_worker(_worker_hasher, _worker_color, chunk)
+
+
+def _chunks(objs: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    it = iter(objs)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_ordered(
+    pool: ProcessPoolExecutor,
+    chunks: Iterator[list[Any]],
+    max_pending: int,
+) -> Iterator[Any]:
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(_color_chunk, chunk))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _map_unordered(
+    pool: ProcessPoolExecutor,
+    chunks: Iterator[list[Any]],
+    max_pending: int,
+) -> Iterator[tuple[Any, Any]]:
+    pending = {}
+    for chunk in chunks:
+        pending[pool.submit(_color_chunk, chunk)] = chunk
+        if len(pending) >= max_pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from zip(pending.pop(future), future.result())
+    for future in as_completed(list(pending)):
+        yield from zip(pending.pop(future), future.result())
+
+
+def _color_hash_map(
+    chunks: Iterator[list[Any]],
+    hasher: ColorHasher,
+    color: str,
+    workers: int,
+    *,
+    ordered: bool,
+) -> Iterator[Any]:
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(hasher, color),
+    ) as pool:
+        if ordered:
+            yield from _map_ordered(pool, chunks, 2 * workers)
+        else:
+            yield from _map_unordered(pool, chunks, 2 * workers)
+
+
+def color_hash_map(  # noqa: PLR0913
+    objs: Iterable[Any],
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    hasher: ColorHasher | None = None,
+    color: str = "hsl",
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    Calculate colors of ``objs`` in a pool of worker processes.
+
+    Input is split into chunks, which are colored by workers. Only a few chunks
+    are in flight at once, so ``objs`` can be a huge (lazy) iterable. Params
+    are sent to each worker once, objects must be picklable.
+
+    Args:
+        objs: objects to color.
+        lightness, saturation, min_h, max_h, hasher: same as for ``ColorHash``.
+        color: one of "hsl", "rgb", "hex" or "rgb_int".
+        workers: number of processes, defaults to number of CPUs.
+        chunksize: number of objects sent to a worker at once.
+        ordered: if set, colors are yielded in order of ``objs``. Otherwise
+                 ``(obj, color)`` pairs are yielded as soon as they are ready.
+
+    Returns:
+        Iterator of colors (or ``(obj, color)`` pairs if not ``ordered``).
+        Params are checked right away, workers start on first ``next()``.
+    """
+    if color not in COLORS:
+        msg = f"color must be one of {COLORS}"
+        raise ValueError(msg)
+    if chunksize < 1:
+        msg = "chunksize must be >= 1"
+        raise ValueError(msg)
+    if hasher is None:
+        hasher = ColorHasher(lightness, saturation, min_h, max_h, table=True)
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(objs, chunksize)
+    return _color_hash_map(chunks, hasher, color, workers, ordered=ordered)
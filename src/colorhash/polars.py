@@ -0,0 +1,142 @@
+"""
+Color whole ``polars`` columns, without any compiled plugin.
+
+Every distinct value is hashed only once and its color is spread back to all
+rows. Nulls stay null.
+
+>>> import polars as pl
+>>> from colorhash.polars import color_hash_expr
+>>> df = pl.DataFrame({"user": ["Hello World", "hey", "Hello World"]})
+>>> df.select(color_hash_expr("user", color="hex"))["user"].to_list()
+['#2dd24b', '#782d86', '#2dd24b']
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+from typing import Sequence
+
+import polars as pl
+
+from .colorhash import ColorHasher
+from .colorhash import get_hasher
+
+DTYPES = {
+    "hsl": pl.List(pl.Float64),
+    "rgb": pl.List(pl.UInt8),
+    "hex": pl.Utf8,
+    "rgb_int": pl.UInt32,
+}
+COLORS = tuple(DTYPES)
+
+
+def _check_color(color: str) -> None:
+    if color not in COLORS:
+        msg = f"color must be one of {COLORS}"
+        raise ValueError(msg)
+
+
+def _equal_values_equal_str(series: pl.Series) -> bool:
+    """
+    Return whether equal values of ``series`` always have equal ``str()``.
+
+    They don't for eg. ``0.0 == -0.0`` (also in lists).
+    """
+    dtype = series.dtype
+    if dtype.is_float():
+        return not (series == 0).any()
+    return not (dtype.is_nested() or dtype == pl.Object)
+
+
+def _factorize(hasher: ColorHasher, series: pl.Series) -> tuple[pl.Series, list]:
+    """
+    Return index of every value into distinct values (null for null) and them.
+
+    Values are distinct as ``ColorHasher.factorize()`` finds them. Polars does
+    it itself if equal values always have equal ``str()``.
+    """
+    if _equal_values_equal_str(series):
+        uniques = series.drop_nulls().unique(maintain_order=True)
+        idx = series.replace_strict(
+            uniques,
+            pl.int_range(len(uniques), dtype=pl.UInt32, eager=True),
+            default=None,
+            return_dtype=pl.UInt32,
+        )
+        return idx, uniques.to_list()
+    present = series.is_not_null()
+    codes, uniques = hasher.factorize(series.filter(present).to_list())
+    idx = pl.Series([None] * len(series), dtype=pl.UInt32)
+    idx.scatter(present.arg_true(), codes)
+    return idx, uniques
+
+
+def _color_series(hasher: ColorHasher, color: str, series: pl.Series) -> pl.Series:
+    idx, uniques = _factorize(hasher, series)
+    color_of = getattr(hasher, color)
+    colors = pl.Series(
+        series.name,
+        [color_of(x) for x in uniques],
+        dtype=DTYPES[color],
+        strict=False,
+    )
+    return colors.gather(idx)
+
+
+def color_hash_series(  # noqa: PLR0913
+    series: pl.Series,
+    lightness: Sequence[float] = (0.35, 0.5, 0.65),
+    saturation: Sequence[float] = (0.35, 0.5, 0.65),
+    min_h: int | None = None,
+    max_h: int | None = None,
+    *,
+    color: str = "hex",
+    encoder: str = "str",
+    hashfunc: str = "crc32",
+    model: str = "hsl",
+    hue_version: int = 1,
+    hasher: ColorHasher | None = None,
+) -> pl.Series:
+    """
+    Return colors of ``series`` values, same as ``ColorHash`` gives for each.
+
+    Args:
+        series: values to color.
+        lightness, saturation, min_h, max_h, encoder, hashfunc, model,
+            hue_version, hasher: same as for ``ColorHash``.
+        color: one of "hsl", "rgb", "hex" or "rgb_int".
+    """
+    _check_color(color)
+    hasher = get_hasher(
+        lightness,
+        saturation,
+        min_h,
+        max_h,
+        encoder=encoder,
+        hashfunc=hashfunc,
+        model=model,
+        hue_version=hue_version,
+        table=True,
+        hasher=hasher,
+    )
+    return _color_series(hasher, color, series)
+
+
+def color_hash_expr(
+    expr: pl.Expr | str,
+    color: str = "hex",
+    **kwargs: Any,
+) -> pl.Expr:
+    """
+    Return expression coloring values of ``expr`` (or column of that name).
+
+    Takes the same params as ``color_hash_series()``.
+    """
+    _check_color(color)
+    if isinstance(expr, str):
+        expr = pl.col(expr)
+    return expr.map_batches(
+        partial(color_hash_series, color=color, **kwargs),
+        return_dtype=DTYPES[color],
+    )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from colorhash.aio import color_hash_batch
+from colorhash.colorhash import COLORS
+from colorhash.colorhash import ColorHasher
+
+KEYS = [f"user-{i}" for i in range(3000)]
+
+
+@pytest.mark.parametrize("color", COLORS)
+@pytest.mark.parametrize("inline_threshold", [0, 10_000])
+def test_color_hash_batch(color: str, inline_threshold: int):
+    hasher = ColorHasher(lightness=[0.5], max_h=200)
+    result = asyncio.run(
+        color_hash_batch(
+            iter(KEYS),
+            lightness=[0.5],
+            max_h=200,
+            color=color,
+            inline_threshold=inline_threshold,
+            chunksize=128,
+            max_concurrency=2,
+        ),
+    )
+    assert result == [getattr(hasher, color)(key) for key in KEYS]
+
+
+@pytest.mark.parametrize("pool_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_color_hash_batch_executor(pool_class):
+    hasher = ColorHasher(saturation=[0.9], table=True)
+    with pool_class(max_workers=2) as pool:
+        result = asyncio.run(
+            color_hash_batch(
+                KEYS,
+                hasher=hasher,
+                color="hex",
+                executor=pool,
+                inline_threshold=0,
+                chunksize=500,
+            ),
+        )
+    assert result == [hasher.hex(key) for key in KEYS]
+
+
+@pytest.mark.parametrize("inline_threshold", [0, 10_000])
+def test_color_hash_batch_uses_hasher(inline_threshold: int):
+    # equal hasher used before must not replace the passed one
+    keys = KEYS[:10]
+    asyncio.run(color_hash_batch(keys))
+    hasher = ColorHasher(cache_size=100)
+    asyncio.run(
+        color_hash_batch(
+            keys,
+            hasher=hasher,
+            inline_threshold=inline_threshold,
+            chunksize=5,
+        ),
+    )
+    assert hasher.cache.cache_info().misses == len(keys)
+
+
+def test_color_hash_batch_does_not_block_loop():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        await color_hash_batch(KEYS * 10, inline_threshold=0, chunksize=1000)
+        task.cancel()
+
+    asyncio.run(main())
+    assert ticks > 1
+
+
+@pytest.mark.parametrize(
+    ("err", "kwargs"),
+    [
+        ("color must be", {"color": "cmyk"}),
+        ("chunksize and max_concurrency", {"chunksize": 0}),
+        ("chunksize and max_concurrency", {"max_concurrency": 0}),
+        ("params must be in range", {"saturation": [2.0]}),
+    ],
+)
+def test_color_hash_batch_invalid_args(err: str, kwargs: dict):
+    with pytest.raises(ValueError, match=err):
+        asyncio.run(color_hash_batch(KEYS, **kwargs))
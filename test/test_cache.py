@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from colorhash.aio import color_hash_batch
+from colorhash.cache import CacheInfo
+from colorhash.cache import LRUCache
+from colorhash.cache import SharedMemoryCache
+from colorhash.cache import SQLiteCache
+from colorhash.colorhash import ColorHash
+from colorhash.colorhash import ColorHasher
+from colorhash.colorhash import color_hash
+from colorhash.parallel import color_hash_map
+from test.constants import OBJECTS
+
+KEYS = [f"user-{i}" for i in range(500)]
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+    assert len(cache) == 2  # noqa: PLR2004
+    assert cache.cache_info() == CacheInfo(hits=3, misses=1, maxsize=2, currsize=2)
+
+
+def test_lru_cache_clear():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_lru_cache_zero_size():
+    cache = LRUCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError, match="maxsize must be"):
+        LRUCache(maxsize=-1)
+
+
+@pytest.mark.parametrize("table", [False, True])
+def test_color_hasher_cache(table: bool):  # noqa: FBT001
+    hasher = ColorHasher()
+    cached = ColorHasher(cache_size=10, table=table)
+    for _ in range(2):
+        for obj in OBJECTS:
+            assert cached.hsl(obj) == hasher.hsl(obj)
+            assert cached.rgb(obj) == hasher.rgb(obj)
+            assert cached.hex(obj) == hasher.hex(obj)
+    info = cached.cache.cache_info()
+    assert info.currsize == 10  # noqa: PLR2004
+    assert info.hits + info.misses == 6 * len(OBJECTS)
+
+
+def test_color_hasher_cache_threads():
+    hasher = ColorHasher()
+    cached = ColorHasher(cache_size=20)
+    keys = [f"user-{i % 50}" for i in range(5000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        result = list(pool.map(cached.hex, keys))
+    assert result == [hasher.hex(key) for key in keys]
+    info = cached.cache.cache_info()
+    assert info.hits + info.misses == len(keys)
+    assert info.currsize == 20  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"min_h": 10, "max_h": 20}, {"model": "oklch", "hue_version": 2}],
+)
+def test_color_hasher_cache_path(tmp_path, params: dict):
+    path = tmp_path / "colors.db"
+    hasher = ColorHasher(**params)
+    cold = ColorHasher(cache_path=path, **params)
+    assert [cold.hsl_rgb_hex(obj) for obj in OBJECTS] == [
+        hasher.hsl_rgb_hex(obj) for obj in OBJECTS
+    ]
+    cold.cache.close()
+
+    warm = ColorHasher(cache_path=path, **params)
+    assert [warm.hsl_rgb_hex(obj) for obj in OBJECTS] == [
+        hasher.hsl_rgb_hex(obj) for obj in OBJECTS
+    ]
+    info = warm.cache.cache_info()
+    assert info.misses == 0
+    assert info.currsize == len({repr(obj) for obj in OBJECTS})
+
+
+def test_color_hasher_cache_path_configurations(tmp_path):
+    path = tmp_path / "colors.db"
+    with ColorHasher(cache_path=path).cache as cache:
+        cache.set(b"a", ((1, 0.5, 0.5), (1, 2, 3), "#010203"))
+    other = ColorHasher(lightness=[0.5], cache_path=path)
+    assert other.hex("a") == ColorHasher(lightness=[0.5]).hex("a")
+    assert ColorHasher(cache_path=path).hex("a") == "#010203"
+
+
+def test_color_hasher_prefetch(tmp_path):
+    path = tmp_path / "colors.db"
+    keys = [f"user-{i}" for i in range(2000)]
+    hasher = ColorHasher(cache_path=path)
+    assert hasher.prefetch(keys) == 0
+    expected = [hasher.hex(key) for key in keys]
+    hasher.cache.close()
+
+    warm = ColorHasher(cache_path=path)
+    assert warm.prefetch([*keys, "other"]) == len(keys)
+    warm.cache._conn.close()  # noqa: SLF001
+    assert [warm.hex(key) for key in keys] == expected
+    assert ColorHasher().prefetch(keys) == 0
+
+
+def test_sqlite_cache_eviction(tmp_path):
+    path = tmp_path / "colors.db"
+    colors = ((1, 0.5, 0.5), (1, 2, 3), "#010203")
+    with SQLiteCache(path, maxsize=5, batch_size=2) as cache:
+        for i in range(12):
+            cache.set(str(i).encode(), colors)
+    cache = SQLiteCache(path, maxsize=5)
+    assert len(cache) == 5  # noqa: PLR2004
+    assert cache.prefetch(str(i).encode() for i in range(12)) == 5  # noqa: PLR2004
+    assert cache.get(b"0") is None
+    assert cache.get(b"11") == colors
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=5, currsize=0)
+    cache.close()
+    cache.close()
+    for method, args in [("get", [b"0"]), ("set", [b"0", colors]), ("flush", [])]:
+        with pytest.raises(ValueError, match="cache is closed"):
+            getattr(cache, method)(*args)
+
+
+def test_sqlite_cache_mem_size(tmp_path):
+    path = tmp_path / "colors.db"
+    colors = ((1, 0.5, 0.5), (1, 2, 3), "#010203")
+    keys = [str(i).encode() for i in range(101)]
+    mem_size = 2
+    with SQLiteCache(path, maxsize=100, batch_size=1, mem_size=mem_size) as cache:
+        for key in keys:
+            cache.set(key, colors)
+        assert len(cache._mem) == mem_size  # noqa: SLF001
+        # a tenth more removed at once
+        assert len(cache) == 90  # noqa: PLR2004
+        assert cache.get(b"10") is None
+        assert cache.get(b"11") == colors
+    with SQLiteCache(path, maxsize=100, mem_size=mem_size) as cache:
+        assert len(cache) == 90  # noqa: PLR2004
+        assert cache.prefetch(keys) == 90  # noqa: PLR2004
+        assert len(cache._mem) == mem_size  # noqa: SLF001
+
+
+def _set_and_flush(cache: SQLiteCache, key: bytes, colors: tuple) -> None:
+    cache.set(key, colors)
+    cache.flush()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_sqlite_cache_fork(tmp_path):
+    path = tmp_path / "colors.db"
+    colors = ((1, 0.5, 0.5), (1, 2, 3), "#010203")
+    cache = SQLiteCache(path)
+    cache.set(b"parent", colors)
+    ctx = multiprocessing.get_context("fork")
+    proc = ctx.Process(target=_set_and_flush, args=(cache, b"child", colors))
+    proc.start()
+    proc.join()
+    assert proc.exitcode == 0
+    # pending row of parent is not written by child
+    with SQLiteCache(path) as other:
+        assert other.prefetch([b"parent", b"child"]) == 1
+        assert other.get(b"child") == colors
+    cache.close()
+    with SQLiteCache(path) as other:
+        assert other.prefetch([b"parent", b"child"]) == 2  # noqa: PLR2004
+
+
+def test_sqlite_cache_invalid_size(tmp_path):
+    with pytest.raises(ValueError, match="maxsize must be"):
+        SQLiteCache(tmp_path / "colors.db", batch_size=0)
+
+
+def test_color_hasher_cache_path_pickle(tmp_path):
+    hasher = ColorHasher(cache_path=tmp_path / "colors.db", cache_size=100)
+    restored = pickle.loads(pickle.dumps(hasher))
+    assert restored.cache_path == hasher.cache_path
+    assert restored.cache.maxsize == 100  # noqa: PLR2004
+    assert restored.cache is not hasher.cache
+
+
+def test_color_hasher_cache_path_close(tmp_path):
+    path = tmp_path / "colors.db"
+    with ColorHasher(cache_path=path) as hasher:
+        hasher.hex("a")
+    hasher.close()
+    assert len(ColorHasher(cache_path=path).cache) == 1
+    with ColorHasher(cache_size=10) as hasher:
+        hasher.hex("a")
+
+
+def test_color_hasher_cache_path_collected(tmp_path):
+    path = tmp_path / "colors.db"
+
+    def job():
+        hasher = ColorHasher(cache_path=path)
+        for key in KEYS:
+            hasher.hex(key)
+
+    job()
+    gc.collect()
+    assert ColorHasher(cache_path=path).prefetch(KEYS) == len(KEYS)
+
+
+@pytest.mark.parametrize("use_aio", [False, True])
+def test_color_hasher_cache_path_workers(tmp_path, use_aio: bool):  # noqa: FBT001
+    path = tmp_path / "colors.db"
+    hasher = ColorHasher(cache_path=path)
+    if use_aio:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            colors = asyncio.run(
+                color_hash_batch(
+                    KEYS,
+                    hasher=hasher,
+                    color="hex",
+                    executor=pool,
+                    inline_threshold=0,
+                    chunksize=100,
+                ),
+            )
+    else:
+        colors = list(
+            color_hash_map(KEYS, hasher=hasher, color="hex", workers=2, chunksize=100),
+        )
+    assert colors == [ColorHasher().hex(key) for key in KEYS]
+    # colored (and written) by workers only
+    assert hasher.cache.cache_info().misses == 0
+    assert hasher.prefetch(KEYS) == len(KEYS)
+
+
+def test_color_hash_with_hasher(tmp_path):
+    hasher = ColorHasher(cache_path=tmp_path / "colors.db")
+    assert color_hash("a", hasher=hasher) == color_hash("a")
+    assert ColorHash("a", hasher=hasher).hex == ColorHash("a").hex
+    assert hasher.cache.cache_info().hits == 1
+
+
+@pytest.fixture
+def shared_hasher():
+    hasher = ColorHasher(shared_cache=True, cache_size=1000)
+    yield hasher
+    hasher.cache.close()
+    hasher.cache.unlink()
+
+
+def test_color_hasher_shared_cache(shared_hasher: ColorHasher):
+    hasher = ColorHasher()
+    for _ in range(2):
+        for obj in OBJECTS:
+            assert shared_hasher.hsl_rgb_hex(obj) == hasher.hsl_rgb_hex(obj)
+            assert shared_hasher.rgb_int(obj) == hasher.rgb_int(obj)
+    info = shared_hasher.cache.cache_info()
+    assert info.maxsize == 1024  # noqa: PLR2004
+    assert info.currsize == len({repr(obj) for obj in OBJECTS})
+    assert info.misses == info.currsize
+    shared_hasher.cache.cache_clear()
+    assert shared_hasher.cache.cache_info() == CacheInfo(0, 0, 1024, 0)
+
+
+def test_color_hasher_shared_cache_processes(shared_hasher: ColorHasher):
+    keys = [f"user-{i}" for i in range(200)]
+    # hasher is pickled, workers attach to the same shared memory
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        result = list(pool.map(shared_hasher.hex, keys))
+    assert result == [ColorHasher().hex(key) for key in keys]
+    assert [shared_hasher.hex(key) for key in keys] == result
+    assert shared_hasher.cache.cache_info().misses == 0
+
+
+def test_shared_cache_attach_other_params(shared_hasher: ColorHasher):
+    name = shared_hasher.cache.name
+    with pytest.raises(ValueError, match="other params"):
+        ColorHasher(lightness=[0.5], shared_cache=name)
+    attached = ColorHasher(shared_cache=name)
+    assert attached.cache.maxsize == 1024  # noqa: PLR2004
+    attached.cache.close()
+
+
+def test_shared_cache_full_and_torn_slots():
+    table = ["red", "green"]
+    cache = SharedMemoryCache(table, slots=4)
+    try:
+        keys = [str(i).encode() for i in range(6)]
+        for key in keys:
+            cache.set(key, "green")
+        assert len(cache) == 4  # noqa: PLR2004
+        assert [cache.get(key) for key in keys].count("green") == 4  # noqa: PLR2004
+        # slot with bad check (being written) is a miss
+        words = cache._words  # noqa: SLF001
+        used = next(i for i in range(0, len(words), 2) if words[i])
+        words[used + 1] &= 0xFFFFFFFF
+        assert [cache.get(key) for key in keys].count("green") == 3  # noqa: PLR2004
+    finally:
+        cache.close()
+        cache.unlink()
+
+
+def test_shared_cache_invalid_size():
+    with pytest.raises(ValueError, match="slots must be"):
+        SharedMemoryCache([], slots=0)
@@ -1,16 +1,41 @@
 from __future__ import annotations
 
 import importlib.metadata
+import subprocess
+import sys
 from typing import Any
+from zlib import crc32
 
 import pytest
 
 from colorhash import ColorHash
+from colorhash import colorhash as colorhash_module
 from colorhash import get_version
+from colorhash.colorhash import HASH_FUNCTIONS
+from colorhash.colorhash import HASH_STREAM_FUNCTIONS
 from colorhash.colorhash import MAX_HUE
 from colorhash.colorhash import MIN_HUE
+from colorhash.colorhash import ColorHasher
+from colorhash.colorhash import color_hash
+from colorhash.colorhash import color_hash_dedup
+from colorhash.colorhash import color_hash_int
+from colorhash.colorhash import color_hash_int_many
+from colorhash.colorhash import color_hash_many
+from colorhash.colorhash import crc32_hash
+from colorhash.colorhash import crc32_hash_bytes
+from colorhash.colorhash import crc32_hash_canonical
+from colorhash.colorhash import crc32_hash_stream
+from colorhash.colorhash import get_hasher
 from colorhash.colorhash import hsl2rgb
+from colorhash.colorhash import hsl2rgb_float
+from colorhash.colorhash import hsl2rgb_many
+from colorhash.colorhash import int2hex
+from colorhash.colorhash import oklch2rgb
+from colorhash.colorhash import preload
+from colorhash.colorhash import register_hashfunc
 from colorhash.colorhash import rgb2hex
+from colorhash.colorhash import rgb2hex_many
+from colorhash.colorhash import rgb2int
 from test.constants import NAMED_COLORS_HEX
 from test.constants import NAMED_COLORS_HSL
 from test.constants import NAMED_COLORS_RGB
@@ -19,6 +44,14 @@ from test.constants import OBJECTS
 MAX_SATURATION = 1.0
 MAX_LIGHTNESS = 1.0
 
+HASHER_PARAMS = [
+    {},
+    {"min_h": 150},
+    {"max_h": 150},
+    {"min_h": 10, "max_h": 20},
+    {"lightness": [0.95], "saturation": [0.1, 0.95]},
+]
+
 
 @pytest.mark.parametrize(
     "params",
@@ -134,6 +167,246 @@ def test_is_deterministic(obj):
     assert ColorHash(obj).rgb == ColorHash(obj).rgb
 
 
+def test_colorhash_caches_colors():
+    c = ColorHash("Hello World")
+    assert c.rgb is c.rgb
+    assert c.hex is c.hex
+    assert c.hex == rgb2hex(hsl2rgb(c.hsl))
+    with pytest.raises(AttributeError):
+        c.foo = 1
+
+
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_rgb_int(params: dict[str, Any]):
+    hasher = ColorHasher(**params)
+    table_hasher = ColorHasher(**params, table=True)
+    for obj in OBJECTS:
+        c = ColorHash(obj, **params)
+        r, g, b = c.rgb
+        assert c.rgb_int == r << 16 | g << 8 | b
+        assert int2hex(c.rgb_int) == c.hex
+        assert color_hash_int(obj, **params) == c.rgb_int
+        assert hasher.rgb_int(obj) == c.rgb_int
+        assert table_hasher.rgb_int(obj) == c.rgb_int
+
+
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+@pytest.mark.parametrize("table", [False, True])
+def test_rgb_int_many(params: dict[str, Any], table: bool):  # noqa: FBT001
+    np = pytest.importorskip("numpy")
+    expected = [ColorHash(obj, **params).rgb_int for obj in OBJECTS]
+    result = ColorHasher(**params, table=table).rgb_int_many(OBJECTS)
+    assert result.dtype == np.uint32
+    assert result.tolist() == expected
+    assert color_hash_int_many(OBJECTS, **params).tolist() == expected
+
+
+@pytest.mark.parametrize("rgb", NAMED_COLORS_RGB)
+def test_rgb2int(rgb: tuple[int, int, int]):
+    assert int2hex(rgb2int(rgb)) == rgb2hex(rgb)
+
+
+STR_OBJECTS = [obj for obj in OBJECTS if isinstance(obj, str)]
+
+
+@pytest.mark.parametrize("obj", STR_OBJECTS)
+def test_crc32_hash_bytes(obj: str):
+    data = obj.encode("utf-8")
+    assert crc32_hash_bytes(data) == crc32_hash(obj)
+    assert crc32_hash_bytes(bytearray(data)) == crc32_hash(obj)
+    assert crc32_hash_bytes(memoryview(data)) == crc32_hash(obj)
+
+
+@pytest.mark.parametrize("cache_size", [None, 10])
+def test_bytes_encoder(cache_size: int | None):
+    hasher = ColorHasher(encoder="bytes", cache_size=cache_size)
+    for obj in STR_OBJECTS:
+        data = obj.encode("utf-8")
+        c = ColorHash(obj)
+        for buf in (data, bytearray(data), memoryview(data)):
+            assert ColorHash(buf, encoder="bytes").hex == c.hex
+            assert color_hash(buf, encoder="bytes") == c.hsl
+            assert hasher.hsl_rgb_hex(buf) == (c.hsl, c.rgb, c.hex)
+
+
+def test_bytes_encoder_rejects_str():
+    with pytest.raises(TypeError):
+        ColorHash("hey", encoder="bytes")
+
+
+def test_invalid_encoder():
+    with pytest.raises(ValueError, match="encoder must be one of"):
+        ColorHasher(encoder="utf-16")
+
+
+@pytest.mark.parametrize("obj", OBJECTS)
+def test_canonical_encoder(obj: Any):
+    text = str(obj)
+    if isinstance(obj, dict) and obj:
+        # items sorted by repr of key
+        items = sorted((repr(key), repr(value)) for key, value in obj.items())
+        text = "{" + ", ".join(f"{key}: {value}" for key, value in items) + "}"
+    elif isinstance(obj, set) and obj:
+        text = "{" + ", ".join(sorted(map(repr, obj))) + "}"
+    assert crc32_hash_canonical(obj) == crc32_hash(text)
+    hasher = ColorHasher(encoder="canonical", cache_size=10)
+    assert hasher.hex(obj) == ColorHash(obj, encoder="canonical").hex
+    assert hasher.hex(obj) == ColorHash(obj, encoder="canonical").hex
+
+
+def test_canonical_encoder_order():
+    nested = [{"b": {3, 1, 2}, "a": frozenset({"y", "x"})}, ({2: None, 1: ()},)]
+    text = "[{'a': frozenset({'x', 'y'}), 'b': {1, 2, 3}}, ({1: (), 2: None},)]"
+    assert crc32_hash_canonical(nested) == crc32_hash(text)
+    for hashfunc in HASH_FUNCTIONS:
+        hasher = ColorHasher(encoder="canonical", hashfunc=hashfunc)
+        assert hasher.hex({"x": 1, "y": 2}) == hasher.hex({"y": 2, "x": 1})
+        assert hasher.hex({1, 2, 3}) == hasher.hex({3, 2, 1})
+
+
+def test_canonical_encoder_recursive_containers():
+    items: list[Any] = [1]
+    items.append(items)
+    # keys in sorted order, so canonical text is the same as "str()"
+    mapping: dict[str, Any] = {"a": items}
+    mapping["b"] = mapping
+    inner: list[Any] = []
+    outer = (inner,)
+    inner.append(outer)
+    for obj in (items, mapping, outer, [mapping, items]):
+        assert crc32_hash_canonical(obj) == crc32_hash(obj)
+        assert ColorHash(obj, encoder="canonical").hex == ColorHash(obj).hex
+
+
+def test_canonical_encoder_big_containers():
+    big = tuple(range(100_000))
+    assert crc32_hash_canonical(big) == crc32_hash(big)
+    assert crc32_hash_canonical([[x] for x in big]) == crc32_hash([[x] for x in big])
+    keys = [f"key-{x:06}" for x in big]
+    assert crc32_hash_canonical(set(keys)) == crc32_hash("{" + str(keys)[1:-1] + "}")
+
+
+def test_canonical_encoder_across_processes():
+    code = (
+        "from colorhash import ColorHash; "
+        "print(ColorHash({'a', 'b', 'c', 'd'}, encoder='canonical').hex)"
+    )
+    colors = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={"PYTHONHASHSEED": str(seed)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in range(4)
+    }
+    assert colors == {ColorHash("{'a', 'b', 'c', 'd'}").hex + "\n"}
+
+
+def test_color_hash_many_bytes_encoder():
+    np = pytest.importorskip("numpy")
+    arr = np.array([obj.encode("utf-8") for obj in STR_OBJECTS])
+    h, s, l = color_hash_many(arr, encoder="bytes")  # noqa: E741
+    expected = [color_hash(obj) for obj in STR_OBJECTS]
+    assert list(zip(h.tolist(), s.tolist(), l.tolist())) == expected
+
+
+@pytest.mark.parametrize("hashfunc", list(HASH_FUNCTIONS))
+@pytest.mark.parametrize("cache_size", [None, 10])
+def test_hashfunc(hashfunc: str, cache_size: int | None):
+    func = HASH_FUNCTIONS[hashfunc]
+    hasher = ColorHasher(hashfunc=hashfunc, cache_size=cache_size)
+    bytes_hasher = ColorHasher(hashfunc=hashfunc, encoder="bytes")
+    for obj in OBJECTS:
+        hash_val = func(str(obj).encode("utf-8"))
+        assert 0 <= hash_val <= 0xFFFFFFFF  # noqa: PLR2004
+        assert ColorHash(obj, hashfunc=hashfunc).hsl == hasher.hsl(obj)
+        assert hasher.hsl(obj) == bytes_hasher.hsl(str(obj).encode("utf-8"))
+        assert hasher.hsl(obj)[0] == hash_val % 359
+    assert color_hash("hey", hashfunc=hashfunc) == hasher.hsl("hey")
+
+
+def test_hashfunc_default_is_crc32():
+    for obj in OBJECTS:
+        assert ColorHash(obj, hashfunc="crc32").hex == ColorHash(obj).hex
+
+
+def test_invalid_hashfunc():
+    with pytest.raises(ValueError, match="hashfunc must be one of"):
+        ColorHasher(hashfunc="md4")
+
+
+def test_register_hashfunc(monkeypatch):
+    monkeypatch.setattr("colorhash.colorhash.HASH_FUNCTIONS", dict(HASH_FUNCTIONS))
+    register_hashfunc("length", len)
+    assert ColorHash("hey", hashfunc="length").hsl[0] == 3  # noqa: PLR2004
+    with pytest.raises(ValueError, match="already registered"):
+        register_hashfunc("crc32", len)
+
+
+def test_register_hashfunc_stream(monkeypatch):
+    monkeypatch.setattr("colorhash.colorhash.HASH_FUNCTIONS", dict(HASH_FUNCTIONS))
+    monkeypatch.setattr(
+        "colorhash.colorhash.HASH_STREAM_FUNCTIONS",
+        dict(HASH_STREAM_FUNCTIONS),
+    )
+    register_hashfunc("length", len)
+    with pytest.raises(ValueError, match="can't hash streams"):
+        ColorHash.from_stream([b"hey"], hashfunc="length")
+    register_hashfunc("size", len, lambda chunks: sum(map(len, chunks)))
+    assert ColorHash.from_stream([b"he", b"y"], hashfunc="size").hsl[0] == 3  # noqa: PLR2004
+
+
+def test_register_hashfunc_stream_keeps_chunks(monkeypatch, tmp_path):
+    monkeypatch.setattr("colorhash.colorhash.HASH_FUNCTIONS", dict(HASH_FUNCTIONS))
+    monkeypatch.setattr(
+        "colorhash.colorhash.HASH_STREAM_FUNCTIONS",
+        dict(HASH_STREAM_FUNCTIONS),
+    )
+    register_hashfunc("joined", crc32, lambda chunks: crc32(b"".join(chunks)))
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)))
+    c = ColorHash.from_file(path, chunk_size=10, hashfunc="joined")
+    assert c.hsl == ColorHash(bytes(range(256)), encoder="bytes").hsl
+
+
+@pytest.mark.parametrize("obj", OBJECTS)
+def test_crc32_hash_stream(obj: Any):
+    data = str(obj).encode()
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    assert crc32_hash_stream(chunks) == crc32_hash(obj)
+    assert crc32_hash_stream(memoryview(chunk) for chunk in chunks) == crc32_hash(obj)
+    assert crc32_hash_stream([]) == crc32_hash_bytes(b"")
+
+
+@pytest.mark.parametrize("hashfunc", ["crc32", "adler32", "blake2b"])
+def test_from_stream(hashfunc: str):
+    for obj in OBJECTS:
+        data = str(obj).encode()
+        chunks = [data[:5], b"", data[5:]]
+        assert HASH_STREAM_FUNCTIONS[hashfunc](chunks) == HASH_FUNCTIONS[hashfunc](data)
+        c = ColorHash.from_stream(iter(chunks), hashfunc=hashfunc, min_h=10)
+        expected = ColorHash(data, encoder="bytes", hashfunc=hashfunc, min_h=10)
+        assert (c.hsl, c.rgb, c.hex) == (expected.hsl, expected.rgb, expected.hex)
+
+
+@pytest.mark.parametrize("size", [0, 1, 6, 7, 100])
+def test_from_file(tmp_path, size: int):
+    data = (bytes(range(256)) * 2)[: size * 3]
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    hasher = ColorHasher(model="oklch")
+    c = ColorHash.from_file(path, chunk_size=7, hasher=hasher)
+    assert (c.hsl, c.rgb, c.hex) == hasher.hsl_rgb_hex_stream([data])
+    assert c.hex == ColorHash(data, encoder="bytes", model="oklch").hex
+    assert ColorHash.from_file(str(path), [0.5]).hsl == color_hash(
+        data,
+        [0.5],
+        encoder="bytes",
+    )
+
+
 @pytest.mark.parametrize(
     ("hsl", "rgb"),
     tuple(zip(NAMED_COLORS_HSL, NAMED_COLORS_RGB)),
@@ -142,6 +415,24 @@ def test_hsl2rgb(hsl: tuple[float, float, float], rgb: tuple[int, int, int]):
     assert hsl2rgb(hsl=hsl) == rgb
 
 
+@pytest.mark.parametrize(
+    ("hsl", "rgb"),
+    tuple(zip(NAMED_COLORS_HSL, NAMED_COLORS_RGB)),
+)
+def test_hsl2rgb_float(hsl: tuple[float, float, float], rgb: tuple[int, int, int]):
+    assert hsl2rgb_float(hsl=hsl) == rgb
+
+
+@pytest.mark.parametrize("s", [0, 0.1, 0.35, 0.5, 0.65, 0.95, 1.0])
+@pytest.mark.parametrize("l", [0, 0.1, 0.35, 0.5, 0.65, 0.95, 1.0])
+def test_hsl2rgb_integer_hues(s: float, l: float):  # noqa: E741
+    for h in range(MAX_HUE):
+        assert hsl2rgb((h, s, l)) == hsl2rgb_float((h, s, l))
+    # float and out of range hues
+    for h in (0.5, 131.0, 358.9, 360, -1, 500):
+        assert hsl2rgb((h, s, l)) == hsl2rgb_float((h, s, l))
+
+
 @pytest.mark.parametrize(
     ("rgb", "hex"),
     tuple(zip(NAMED_COLORS_RGB, NAMED_COLORS_HEX)),
@@ -150,5 +441,330 @@ def test_rgb2hex(rgb: tuple[int, int, int], hex: str):
     assert rgb2hex(rgb=rgb) == hex
 
 
+@pytest.mark.parametrize("rgb", [None, "abc", (255.0, 0, 0), (0, 0, 1.5)])
+def test_rgb2hex_invalid(rgb: Any):
+    with pytest.raises(ValueError):  # noqa: PT011
+        rgb2hex(rgb)
+    with pytest.raises(ValueError):  # noqa: PT011
+        rgb2hex_many([rgb])
+
+
+@pytest.mark.parametrize(
+    ("rgb", "hex"),
+    [
+        ((256, 0, 0), "#1000000"),
+        ((-1, 0, 0), "#-10000"),
+        ((True, 0, 0), "#010000"),
+        ((1, 2, 3, 4), "#010203"),
+    ],
+)
+def test_rgb2hex_unchecked(rgb: Any, hex: str):
+    # formatted as they always were, only "rgb2hex_many()" checks values
+    assert rgb2hex(rgb) == hex
+    with pytest.raises(ValueError):  # noqa: PT011
+        rgb2hex_many([rgb])
+
+
+def test_rgb2hex_numpy_ints():
+    np = pytest.importorskip("numpy")
+    rgb = tuple(np.array([255, 0, 128], dtype=np.uint8))
+    assert rgb2hex(rgb) == "#ff0080"
+    assert rgb2hex_many([rgb]) == b"#ff0080\n"
+
+
+def test_rgb2hex_many():
+    expected = "".join(f"{x}\n" for x in NAMED_COLORS_HEX).encode()
+    assert rgb2hex_many(NAMED_COLORS_RGB) == expected
+    assert rgb2hex_many(iter(NAMED_COLORS_RGB), sep=b"") == expected.replace(b"\n", b"")
+    assert rgb2hex_many([]) == bytearray()
+
+
+def test_rgb2hex_many_array():
+    np = pytest.importorskip("numpy")
+    expected = "".join(f"{x}," for x in NAMED_COLORS_HEX).encode()
+    rgbs = np.array(NAMED_COLORS_RGB, dtype=np.uint8)
+    assert rgb2hex_many(rgbs, sep=b",") == expected
+    packed = np.array([rgb2int(rgb) for rgb in NAMED_COLORS_RGB], dtype=np.uint32)
+    assert rgb2hex_many(packed, sep=b",") == expected
+    assert rgb2hex_many(color_hash_int_many(OBJECTS)) == rgb2hex_many(
+        [ColorHash(obj).rgb for obj in OBJECTS],
+    )
+    for invalid in (np.array([[0, 256, 0]]), np.array([-1]), np.zeros((2, 2))):
+        with pytest.raises(ValueError):  # noqa: PT011
+            rgb2hex_many(invalid)
+
+
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_color_hasher(params: dict[str, Any]):
+    hasher = ColorHasher(**params)
+    for obj in OBJECTS:
+        c = ColorHash(obj, **params)
+        assert hasher.hsl(obj) == c.hsl == color_hash(obj, **params)
+        assert hasher.rgb(obj) == c.rgb
+        assert hasher.hex(obj) == c.hex
+        assert ColorHash(obj, hasher=hasher).hex == c.hex
+
+
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_color_hasher_table(params: dict[str, Any]):
+    hasher = ColorHasher(**params)
+    table_hasher = ColorHasher(**params, table=True)
+    for obj in OBJECTS:
+        colors = (hasher.hsl(obj), hasher.rgb(obj), hasher.hex(obj))
+        assert table_hasher.hsl_rgb_hex(obj) == colors
+        assert hasher.hsl_rgb_hex(obj) == colors
+        assert table_hasher.hsl(obj) == colors[0]
+        assert table_hasher.rgb(obj) == colors[1]
+        assert table_hasher.hex(obj) == colors[2]
+        c = ColorHash(obj, hasher=table_hasher)
+        assert (c.hsl, c.rgb, c.hex) == colors
+
+
+def test_color_hasher_is_frozen():
+    lightness = [0.5]
+    hasher = ColorHasher(lightness=lightness)
+    lightness.append(0.6)
+    assert hasher.lightness == (0.5,)
+    assert hasher == ColorHasher(lightness=(0.5,))
+    assert hash(hasher) == hash(ColorHasher(lightness=(0.5,)))
+    assert hasher != ColorHasher()
+    with pytest.raises(AttributeError):
+        hasher.foo = 1
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"min_h": 10, "max_h": 0}, {"lightness": (1.1,)}, {"saturation": [-0.1]}],
+)
+def test_color_hasher_unsupported_params(params: dict[str, Any]):
+    with pytest.raises(ValueError, match="must be in range"):
+        ColorHasher(**params)
+
+
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_color_hash_many(params: dict[str, Any]):
+    np = pytest.importorskip("numpy")
+    h, s, l = color_hash_many(OBJECTS, **params)  # noqa: E741
+    expected = [color_hash(obj, **params) for obj in OBJECTS]
+    assert list(zip(h.tolist(), s.tolist(), l.tolist())) == expected
+
+    r, g, b = hsl2rgb_many(h, s, l)
+    assert r.dtype == np.uint8
+    assert list(zip(r.tolist(), g.tolist(), b.tolist())) == [
+        hsl2rgb(hsl) for hsl in expected
+    ]
+
+
+def test_color_hash_many_numpy_input():
+    np = pytest.importorskip("numpy")
+    keys = ["Hello World", "hey", "\u03a9"]
+    for arr in (np.array(keys), np.array([k.encode() for k in keys])):
+        h, s, l = color_hash_many(arr)  # noqa: E741
+        expected = [color_hash(x) for x in arr.tolist()]
+        assert list(zip(h.tolist(), s.tolist(), l.tolist())) == expected
+
+
+def test_hsl2rgb_many():
+    pytest.importorskip("numpy")
+    h, s, l = zip(*NAMED_COLORS_HSL)  # noqa: E741
+    r, g, b = hsl2rgb_many(h, s, l)
+    assert list(zip(r.tolist(), g.tolist(), b.tolist())) == NAMED_COLORS_RGB
+
+
 def test_get_version():
     assert get_version(None) == importlib.metadata.version("colorhash")
+
+
+@pytest.mark.parametrize("color", ["hsl", "rgb", "hex", "rgb_int"])
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_dedup_many(color: str, params: dict[str, Any]):
+    objs = list(OBJECTS) * 3
+    hasher = ColorHasher(**params)
+    result = hasher.dedup_many(iter(objs), color=color)
+    assert result.colors == [getattr(hasher, color)(obj) for obj in objs]
+    assert result.colors == [result.key_colors[code] for code in result.codes]
+    assert len(result.keys) == len(result.key_colors) < len(objs)
+    assert result.dedup_ratio == len(objs) / len(result.keys)
+    if color == "hsl":
+        assert result == color_hash_dedup(objs, **params)
+
+
+def test_dedup_many_keys():
+    # equal, but with different "str()", so colors differ
+    objs = [0, 0.0, -0.0, False, (1,), (1.0,), "b'a'", b"a", [1], [1], {1}]
+    result = ColorHasher().dedup_many(objs, color="hex")
+    assert result.colors == [ColorHash(obj).hex for obj in objs]
+    assert result.keys == [*objs[:9], objs[10]]
+    assert result.codes == [0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 9]
+    assert ColorHasher().factorize(iter(objs)) == (result.codes, result.keys)
+
+
+def test_dedup_many_empty():
+    result = ColorHasher().dedup_many([])
+    assert result.colors == result.keys == result.codes == []
+    assert result.dedup_ratio == 1.0
+
+
+def test_dedup_many_invalid_color():
+    with pytest.raises(ValueError, match="color must be one of"):
+        ColorHasher().dedup_many(["a"], color="cmyk")
+
+
+@pytest.mark.parametrize(
+    ("lch", "rgb"),
+    [
+        ((0.0, 0.0, 0.0), (0, 0, 0)),
+        ((1.0, 0.0, 0.0), (255, 255, 255)),
+        ((0.6279554, 0.2576833, 29.2339), (255, 0, 0)),
+        ((0.8664396, 0.2948272, 142.4953), (0, 255, 0)),
+        ((0.4520137, 0.3132143, 264.052), (0, 0, 255)),
+        # out of gamut, chroma is reduced
+        ((0.5, 0.4, 131), (70, 114, 0)),
+    ],
+)
+def test_oklch2rgb(lch: tuple[float, float, float], rgb: tuple[int, int, int]):
+    assert oklch2rgb(lch) == rgb
+
+
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_oklch_model(params: dict[str, Any]):
+    hasher = ColorHasher(**params, model="oklch")
+    assert hasher.table
+    for obj in OBJECTS:
+        h, s, l = color_hash(obj, **params)  # noqa: E741
+        rgb = oklch2rgb((l, s * 0.4, h))
+        assert hasher.hsl_rgb_hex(obj) == ((h, s, l), rgb, rgb2hex(rgb))
+        c = ColorHash(obj, **params, model="oklch")
+        assert (c.hsl, c.rgb, c.hex) == hasher.hsl_rgb_hex(obj)
+        assert color_hash_int(obj, **params, model="oklch") == rgb2int(rgb)
+
+
+def test_oklch_model_converts_used_colors_only():
+    palette = [i / 20 for i in range(1, 20)]
+    hasher = ColorHasher(palette, palette, model="oklch")
+    frozen = ColorHasher(palette, palette, model="oklch").freeze()
+    for obj in OBJECTS:
+        assert hasher.hsl_rgb_hex(obj) == frozen.hsl_rgb_hex(obj)
+        assert hasher.rgb_int(obj) == frozen.rgb_int(obj)
+    assert hasher._table is None  # noqa: SLF001
+    converted = [x for x in hasher._entries if x is not None]  # noqa: SLF001
+    assert len(converted) <= len(OBJECTS) < len(frozen._table)  # noqa: SLF001
+
+
+def test_oklch_model_rgb_int_many():
+    pytest.importorskip("numpy")
+    hasher = ColorHasher(model="oklch")
+    expected = [hasher.rgb_int(obj) for obj in OBJECTS]
+    assert ColorHasher(model="oklch").rgb_int_many(OBJECTS).tolist() == expected
+    assert hasher._table is None  # noqa: SLF001
+    assert hasher.freeze().rgb_int_many(OBJECTS).tolist() == expected
+
+
+def test_oklch_model_params():
+    hasher = ColorHasher(model="oklch")
+    assert hasher != ColorHasher()
+    assert hasher == ColorHasher(model="oklch", table=True)
+    assert "model='oklch'" in repr(hasher)
+    with pytest.raises(ValueError, match="model must be one of"):
+        ColorHasher(model="cmyk")
+
+
+@pytest.mark.parametrize(
+    ("min_h", "max_h", "hues"),
+    [
+        (None, None, set(range(360))),
+        (0, 360, set(range(360))),
+        (10, 20, set(range(10, 21))),
+        (300, 360, set(range(300, 361))),
+        (10, 10, {10}),
+    ],
+)
+def test_hue_version_2(min_h: int | None, max_h: int | None, hues: set[int]):
+    hasher = ColorHasher(min_h=min_h, max_h=max_h, hue_version=2)
+    picked = [hasher.hsl(f"user-{i}")[0] for i in range(100 * len(hues))]
+    assert set(picked) == hues
+    assert all(isinstance(h, int) for h in picked)
+
+
+@pytest.mark.parametrize("table", [False, True])
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_hue_version_2_hasher(params: dict[str, Any], table: bool):  # noqa: FBT001
+    hasher = ColorHasher(**params, table=table, hue_version=2)
+    assert hasher != ColorHasher(**params, table=table)
+    for obj in OBJECTS:
+        hsl = color_hash(obj, **params, hue_version=2)
+        assert hasher.hsl_rgb_hex(obj) == (hsl, hsl2rgb(hsl), rgb2hex(hsl2rgb(hsl)))
+        c = ColorHash(obj, **params, hue_version=2)
+        assert (c.hsl, c.rgb, c.hex) == hasher.hsl_rgb_hex(obj)
+        assert color_hash_int(obj, **params, hue_version=2) == c.rgb_int
+
+
+@pytest.mark.parametrize("params", HASHER_PARAMS)
+def test_hue_version_2_many(params: dict[str, Any]):
+    pytest.importorskip("numpy")
+    h, s, l = color_hash_many(OBJECTS, **params, hue_version=2)  # noqa: E741
+    hsls = [color_hash(obj, **params, hue_version=2) for obj in OBJECTS]
+    assert list(zip(h.tolist(), s.tolist(), l.tolist())) == hsls
+    ints = color_hash_int_many(OBJECTS, **params, hue_version=2).tolist()
+    assert ints == [rgb2int(hsl2rgb(hsl)) for hsl in hsls]
+
+
+def test_hue_version_2_float_bounds():
+    hasher = ColorHasher(min_h=10, max_h=100, hue_version=2)
+    hasher_floats = ColorHasher(min_h=10.0, max_h=100.0, hue_version=2)
+    assert [hasher_floats.hsl(obj) for obj in OBJECTS] == [
+        hasher.hsl(obj) for obj in OBJECTS
+    ]
+    with pytest.raises(ValueError, match="must be whole numbers"):
+        ColorHasher(min_h=10.5, max_h=100, hue_version=2)
+
+
+def test_hue_version_invalid():
+    with pytest.raises(ValueError, match="hue_version must be one of"):
+        ColorHasher(hue_version=3)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [*HASHER_PARAMS, {"model": "oklch"}, {"min_h": 10, "max_h": 20}],
+)
+def test_freeze(params: dict[str, Any]):
+    hasher = ColorHasher(**params, table=True)
+    frozen = ColorHasher(**params).freeze()
+    assert frozen.table
+    assert frozen.freeze() is frozen
+    for obj in OBJECTS:
+        assert frozen.hsl_rgb_hex(obj) == hasher.hsl_rgb_hex(obj)
+        assert type(frozen.hsl(obj)[0]) is type(hasher.hsl(obj)[0])
+        assert frozen.rgb_int(obj) == hasher.rgb_int(obj)
+
+
+def test_preload():
+    configs = [{}, {"lightness": [0.5], "min_h": 10, "max_h": 20, "model": "oklch"}]
+    hashers = preload(configs)
+    assert hashers == [ColorHasher(), ColorHasher(**configs[1])]
+    # same hashers as module functions use
+    assert get_hasher(table=True) is hashers[0]
+    assert get_hasher().table is False
+    plain = get_hasher(**configs[1])
+    frozen_table = colorhash_module._FrozenTable  # noqa: SLF001
+    assert isinstance(plain._lookup_table(), frozen_table)  # noqa: SLF001
+    for obj in OBJECTS:
+        assert color_hash_int(obj) == hashers[0].rgb_int(obj)
+        assert ColorHash(obj, **configs[1]).hex == hashers[1].hex(obj)
+
+
+def test_get_hasher_types():
+    # "1 == 1.0", but they are returned as they are
+    assert get_hasher(lightness=[1]) is not get_hasher(lightness=[1.0])
+    assert type(color_hash("hey", lightness=[1])[2]) is int
+    assert type(color_hash("hey", lightness=[1.0])[2]) is float
+    h, _, _ = color_hash_many(["hey"], min_h=10, max_h=20)
+    assert h.tolist() == [color_hash("hey", min_h=10, max_h=20)[0]]
+
+
+def test_preload_invalid():
+    with pytest.raises(TypeError):
+        preload([{"hue": 1}])
+    with pytest.raises(ValueError, match="model must be one of"):
+        preload([{"model": "lab"}])
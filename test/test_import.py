@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import importlib.metadata
+import subprocess
+import sys
+
+import colorhash
+
+# slow to import and not needed until used
+LAZY_MODULES = ("importlib.metadata", "pathlib", "hashlib", "numpy", "email")
+
+
+def _import_times(tmp_path) -> dict[str, int]:
+    """
+    Return cumulative import time (us) of modules imported by colorhash.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import colorhash"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,  # no pyproject.toml around
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():  # noqa: PLR2004
+            times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def test_import_is_lazy(tmp_path):
+    times = _import_times(tmp_path)
+    assert "colorhash" in times
+    for module in LAZY_MODULES:
+        assert module not in times, f"{module} imported by 'import colorhash'"
+
+
+def test_version():
+    assert colorhash.__version__ == importlib.metadata.version("colorhash")
+    assert "__version__" in vars(colorhash)  # resolved only once
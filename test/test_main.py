@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from colorhash import ColorHash
+from colorhash.__main__ import main  # noqa: PLC2701
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+KEYS = ["Hello World", "hey", "Ω", ""]
+
+
+def _run(monkeypatch, capsys, argv: list[str], data: str) -> str:
+    monkeypatch.setattr(
+        sys,
+        "stdin",
+        io.TextIOWrapper(io.BytesIO(data.encode()), encoding="utf-8"),
+    )
+    assert main(argv) == 0
+    return capsys.readouterr().out
+
+
+def test_main_plain(monkeypatch, capsys):
+    out = _run(monkeypatch, capsys, [], "\n".join(KEYS) + "\n")
+    assert out.splitlines() == [ColorHash(key).hex for key in KEYS]
+
+
+def test_main_crlf_and_missing_newline(monkeypatch, capsys):
+    out = _run(monkeypatch, capsys, [], "Hello World\r\nhey")
+    assert out.splitlines() == [ColorHash("Hello World").hex, ColorHash("hey").hex]
+
+
+def test_main_strips_one_newline(monkeypatch, capsys):
+    out = _run(monkeypatch, capsys, [], "a\r\r\nb\n\r\nc\r")
+    keys = ["a\r", "b", "", "c\r"]
+    assert out.splitlines() == [ColorHash(key).hex for key in keys]
+
+
+def test_main_missing_file(capsys, tmp_path: Path):
+    path = tmp_path / "missing.txt"
+    assert main([str(path)]) == 1
+    assert capsys.readouterr().err == f"colorhash: {path}: No such file or directory\n"
+
+
+def test_main_tsv_params(monkeypatch, capsys):
+    params = ["-c", "hsl", "-f", "tsv", "-l", "0.5", "-s", "0.2,0.4", "--min-h", "10"]
+    out = _run(monkeypatch, capsys, params, "\n".join(KEYS) + "\n")
+    expected = []
+    for key in KEYS:
+        hsl = ColorHash(key, lightness=[0.5], saturation=[0.2, 0.4], min_h=10).hsl
+        expected.append(f"{key}\t{','.join(map(str, hsl))}")
+    assert out.splitlines() == expected
+
+
+def test_main_jsonl_files(capsys, tmp_path: Path):
+    path = tmp_path / "keys.txt"
+    path.write_text("\n".join(KEYS) + "\n", encoding="utf-8")
+    assert main(["-f", "jsonl", "-c", "rgb", str(path), str(path)]) == 0
+    out = capsys.readouterr().out
+    rows = [json.loads(line) for line in out.splitlines()]
+    expected = [{"key": key, "rgb": list(ColorHash(key).rgb)} for key in KEYS]
+    assert rows == expected * 2
+
+
+def test_main_rgb_int(monkeypatch, capsys):
+    out = _run(monkeypatch, capsys, ["-c", "rgb_int", "-f", "jsonl"], "hey\n")
+    assert json.loads(out) == {"key": "hey", "rgb_int": ColorHash("hey").rgb_int}
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--min-h", "400"], ["-l", "1.5"], ["-l", "x"], ["-f", "csv"]],
+)
+def test_main_invalid_args(argv: list[str]):
+    with pytest.raises(SystemExit):
+        main(argv)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from colorhash import ColorHash
+from colorhash.colorhash import ColorHasher
+from colorhash.colorhash import rgb2oklab
+from colorhash.palette import assign_palette
+
+KEYS = [f"series-{i}" for i in range(20)]
+
+
+def _min_delta_e(colors: list[tuple[int, int, int]]) -> float:
+    labs = [rgb2oklab(rgb) for rgb in colors]
+    return min(
+        sum((a - b) ** 2 for a, b in zip(x, y)) ** 0.5 * 100
+        for x, y in itertools.combinations(labs, 2)
+    )
+
+
+def test_assign_palette_distinct():
+    usual = [ColorHash(key).rgb for key in KEYS]
+    assert _min_delta_e(usual) < 1
+    colors = assign_palette(KEYS, color="rgb", min_delta_e=5)
+    assert _min_delta_e(colors) >= 5  # noqa: PLR2004
+    # most keys keep their usual color
+    assert sum(a == b for a, b in zip(colors, usual)) > len(KEYS) / 2
+
+
+def test_assign_palette_deterministic():
+    colors = assign_palette(KEYS)
+    assert assign_palette(reversed(KEYS)) == colors[::-1]
+    assert assign_palette(KEYS + KEYS) == colors + colors
+    # first key (by hashed bytes) always keeps its color
+    assert assign_palette(KEYS)[0] == ColorHash(KEYS[0]).hex
+
+
+@pytest.mark.parametrize("color", ["hsl", "rgb", "hex", "rgb_int"])
+def test_assign_palette_colors(color: str):
+    params = {"lightness": [0.5, 0.7], "min_h": 100, "hue_version": 2}
+    hasher = ColorHasher(**params)
+    colors = assign_palette(KEYS, color=color, **params)
+    assert colors == assign_palette(KEYS, color=color, hasher=hasher)
+    palette = {getattr(hasher, color)(f"key-{i}") for i in range(20_000)}
+    assert set(colors) <= palette
+
+
+def test_assign_palette_unhashable_and_empty():
+    keys = [[1], [1], {"a": 1}, "x"]
+    colors = assign_palette(keys)
+    assert colors[0] == colors[1]
+    assert len(set(colors)) == 3  # noqa: PLR2004
+    assert assign_palette([]) == []
+
+
+def test_assign_palette_saturated():
+    # palette of one (repeated) color, keys keep their usual colors
+    keys = [f"k{i}" for i in range(10)]
+    colors = assign_palette(keys, [0.5], [0.5], 10, 10, max_tries=3)
+    assert colors == [ColorHash(key, [0.5], [0.5], 10, 10).hex for key in keys]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"color": "cmyk"}, {"min_delta_e": 0}, {"max_tries": 0}],
+)
+def test_assign_palette_invalid(kwargs: dict):
+    with pytest.raises(ValueError):  # noqa: PT011
+        assign_palette(KEYS, **kwargs)
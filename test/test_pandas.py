@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from colorhash import ColorHash
+from colorhash.colorhash import ColorHasher
+
+pd = pytest.importorskip("pandas")
+
+import colorhash.pandas  # noqa: E402, F401
+
+KEYS = ["a", "b", "a", 3, None, "b", 3, ("x", 1)]
+
+
+@pytest.mark.parametrize("color", ["hsl", "rgb", "hex", "rgb_int"])
+@pytest.mark.parametrize("params", [{}, {"min_h": 10, "max_h": 20}])
+def test_accessor(color: str, params: dict):
+    series = pd.Series(KEYS, index=list("abcdefgh"), name="key")
+    result = getattr(series.colorhash, color)(**params)
+    assert result.index.equals(series.index)
+    assert result.name == "key"
+    expected = [
+        None if key is None else getattr(ColorHash(key, **params), color)
+        for key in KEYS
+    ]
+    assert [
+        None if pd.api.types.is_scalar(x) and pd.isna(x) else x for x in result
+    ] == expected
+
+
+def test_accessor_rgb_int_dtype():
+    series = pd.Series(["a", "b", "a"])
+    assert series.colorhash.rgb_int().dtype == "uint32"
+    assert pd.Series(["a", None]).colorhash.rgb_int().dtype == "UInt32"
+
+
+def test_accessor_categorical_and_hasher():
+    hasher = ColorHasher(lightness=[0.5], hashfunc="adler32")
+    series = pd.Series(["x", "y", "x"], dtype="category")
+    assert series.colorhash.hex(hasher=hasher).tolist() == [
+        hasher.hex("x"),
+        hasher.hex("y"),
+        hasher.hex("x"),
+    ]
+
+
+def test_accessor_empty():
+    assert pd.Series([], dtype=object).colorhash.hex().tolist() == []
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1, 1.0, True, 0.0, -0.0, None, 1], dtype=object),
+        pd.Series([0.0, -0.0, None, 1.5, 0.0]),
+    ],
+)
+def test_accessor_equal_values_printed_differently(series: pd.Series):
+    expected = [None if pd.isna(x) else ColorHash(x).hex for x in series]
+    result = series.colorhash.hex().tolist()
+    assert [None if pd.isna(x) else x for x in result] == expected
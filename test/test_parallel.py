@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from colorhash.colorhash import COLORS
+from colorhash.colorhash import ColorHasher
+from colorhash.parallel import color_hash_map
+
+KEYS = [f"user-{i}" for i in range(1000)]
+
+
+@pytest.mark.parametrize("color", COLORS)
+def test_color_hash_map(color: str):
+    hasher = ColorHasher(lightness=[0.5], min_h=100)
+    result = color_hash_map(
+        iter(KEYS),
+        lightness=[0.5],
+        min_h=100,
+        color=color,
+        workers=2,
+        chunksize=64,
+    )
+    assert list(result) == [getattr(hasher, color)(key) for key in KEYS]
+
+
+def test_color_hash_map_unordered():
+    hasher = ColorHasher(saturation=[0.9])
+    result = color_hash_map(
+        KEYS,
+        hasher=hasher,
+        color="hex",
+        workers=2,
+        chunksize=7,
+        ordered=False,
+    )
+    assert sorted(result) == sorted((key, hasher.hex(key)) for key in KEYS)
+
+
+@pytest.mark.parametrize(
+    ("err", "kwargs"),
+    [
+        ("color must be", {"color": "cmyk"}),
+        ("chunksize must be", {"chunksize": 0}),
+        ("params must be in range", {"lightness": [2.0]}),
+    ],
+)
+def test_color_hash_map_invalid_args(err: str, kwargs: dict):
+    # raised by the call itself, not on first "next()"
+    with pytest.raises(ValueError, match=err):
+        color_hash_map(KEYS, **kwargs)
+
+
+def test_color_hasher_pickle():
+    hasher = ColorHasher(lightness=[0.5], min_h=10, table=True, cache_size=5)
+    hasher.hex("hey")
+    copy = pickle.loads(pickle.dumps(hasher))
+    assert copy == hasher
+    assert copy.table
+    assert copy.cache.maxsize == 5  # noqa: PLR2004
+    assert len(copy.cache) == 0
+    assert copy.hex("hey") == hasher.hex("hey")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from colorhash import ColorHash
+from colorhash.colorhash import ColorHasher
+
+pl = pytest.importorskip("polars")
+
+from colorhash.polars import color_hash_expr  # noqa: E402
+from colorhash.polars import color_hash_series  # noqa: E402
+
+KEYS = ["a", "b", "a", None, "b", "c"]
+
+
+def _expected(color: str, **params) -> list:
+    colors = [
+        None if key is None else getattr(ColorHash(key, **params), color)
+        for key in KEYS
+    ]
+    # tuples become lists in polars
+    return [list(x) if isinstance(x, tuple) else x for x in colors]
+
+
+@pytest.mark.parametrize("color", ["hsl", "rgb", "hex", "rgb_int"])
+def test_color_hash_series(color: str):
+    result = color_hash_series(pl.Series("key", KEYS), color=color)
+    assert result.to_list() == _expected(color)
+
+
+@pytest.mark.parametrize("color", ["hsl", "rgb", "hex", "rgb_int"])
+def test_color_hash_expr(color: str):
+    frame = pl.DataFrame({"key": KEYS})
+    result = frame.select(color_hash_expr("key", color=color, min_h=10, max_h=20))
+    assert result["key"].to_list() == _expected(color, min_h=10, max_h=20)
+
+
+def test_color_hash_expr_hasher():
+    hasher = ColorHasher(lightness=[0.5], hashfunc="adler32")
+    frame = pl.DataFrame({"key": KEYS})
+    result = frame.with_columns(color=color_hash_expr(pl.col("key"), hasher=hasher))
+    assert result["color"].to_list() == [
+        None if key is None else hasher.hex(key) for key in KEYS
+    ]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[0.0, -0.0, None, 0.0], [[0.0], [-0.0], None, [0.0]]],
+)
+def test_color_hash_series_equal_values_printed_differently(values: list):
+    result = color_hash_series(pl.Series("key", values))
+    assert result.to_list() == [None if x is None else ColorHash(x).hex for x in values]
+
+
+def test_invalid_color():
+    with pytest.raises(ValueError, match="color must be one of"):
+        color_hash_expr("key", color="cmyk")